@@ -1,14 +1,24 @@
+import argparse
+import asyncio
+import csv
+import os
+import re
+import signal
 import subprocess
 import sys
 import textwrap
 import time
 import json
-import shutil
+import multiprocessing
+import urllib.error
+import urllib.request
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, BinaryIO, Set, Tuple
+from collections import Counter
 from datetime import datetime
 import traceback
 
+from utils import fast_rmtree
 from constants import (
     ROOT,
     MAIN_SCRIPT,
@@ -26,69 +36,173 @@ from constants import (
     DEMO_TIMEOUT,
     ALL_PAPER_URLS,
     STEP_MARKERS,
-    STEP_NAMES
+    STEP_NAMES,
+    BATCH_CONCURRENCY,
+    PIP_CACHE_DIR,
+    WHEELHOUSE_DIR,
+    PREFLIGHT_CONCURRENCY,
+    PREFLIGHT_TIMEOUT,
 )
 
-import random
-random.seed() 
+PAPER_URLS: List[str] = ALL_PAPER_URLS
+
+# orjson is optional; it serializes result rows much faster than json
+try:
+    import orjson
+
+    def json_dumps(obj: Any, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    def json_dumps(obj: Any, indent: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+# Error lines are looked up in the tail of a log only
+LOG_TAIL_BYTES = 64 * 1024
+
+# Keywords categorize_error looks for anywhere in the log
+_LOG_KEYWORDS = [
+    "timeout",
+    "no github link found",
+    "git clone failed",
+    "typeerror",
+    "list",
+    "modulenotfounderror",
+    "importerror",
+    "demo generation failed",
+]
+# Highest step first, so detect_last_step can stop at the first hit
+_STEP_ITEMS = sorted(((step, marker.lower()) for step, marker in STEP_MARKERS.items()), reverse=True)
+_LOG_SCAN_RE = re.compile(
+    "|".join(re.escape(p) for p in [*STEP_MARKERS.values(), *_LOG_KEYWORDS]),
+    re.IGNORECASE,
+)
+_REPO_NAME_RE = re.compile(r"Repository successfully cloned into: .*?/([^/\n]+)(?:\s|$)")
+_MISSING_MODULE_RE = re.compile(r"No module named ['\"]([^'\"]+)['\"]")
+
 
-def run_subprocess(cmd: List[str], cwd: Path, timeout: Optional[int] = None) -> subprocess.CompletedProcess:
-    """Run a subprocess with optional timeout and return the result."""
+def kill_process_tree(proc: asyncio.subprocess.Process) -> None:
+    """Kill a subprocess started by run_subprocess_async and all of its descendants."""
     try:
-        return subprocess.run(
-            cmd,
-            cwd=str(cwd),
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-        )
-    except subprocess.TimeoutExpired as e:
+        if os.name == "nt":
+            proc.kill()
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+async def run_subprocess_async(
+    cmd: List[str],
+    cwd: Path,
+    timeout: Optional[int] = None,
+    log_fp: Optional[BinaryIO] = None,
+    env: Optional[Dict[str, str]] = None,
+) -> Tuple[subprocess.CompletedProcess, bool]:
+    """
+    Run a subprocess without blocking the event loop.
+
+    Returns (result, timed_out). A process killed for exceeding timeout
+    reports its real exit status in result; timed_out says why it ended.
+    If log_fp is given, stdout and stderr are streamed straight into it
+    instead of being buffered in memory, and the result carries no output.
+    """
+    if log_fp is not None:
+        stdout_target, stderr_target = log_fp, subprocess.STDOUT
+    else:
+        stdout_target, stderr_target = asyncio.subprocess.PIPE, asyncio.subprocess.PIPE
+
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=str(cwd),
+        env=env,
+        stdout=stdout_target,
+        stderr=stderr_target,
+        # Own process group, so a timeout can take down pip/git descendants too
+        start_new_session=(os.name != "nt"),
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        kill_process_tree(proc)
+        stdout, stderr = await proc.communicate()
+        timeout_msg = f"TIMEOUT after {timeout}s\n"
+        if log_fp is not None:
+            log_fp.write(f"\n{timeout_msg}".encode())
+            log_fp.flush()
         return subprocess.CompletedProcess(
             args=cmd,
-            returncode=-1,
-            stdout=e.stdout.decode() if e.stdout else "",
-            stderr=f"TIMEOUT after {timeout}s\n" + (e.stderr.decode() if e.stderr else ""),
-        )
+            returncode=proc.returncode,
+            stdout=stdout.decode(errors="replace") if stdout else "",
+            stderr=timeout_msg + (stderr.decode(errors="replace") if stderr else ""),
+        ), True
 
+    return subprocess.CompletedProcess(
+        args=cmd,
+        returncode=proc.returncode,
+        stdout=stdout.decode(errors="replace") if stdout else "",
+        stderr=stderr.decode(errors="replace") if stderr else "",
+    ), False
 
-def detect_last_step(log_text: str) -> int:
-    """Detect the highest step number that appears in the main.py log."""
-    last_step = 0
-    for step, marker in STEP_MARKERS.items():
-        if marker in log_text:
-            last_step = max(last_step, step)
-    return last_step
 
+def read_log_tail(log_path: Path, max_bytes: int = LOG_TAIL_BYTES) -> str:
+    """Return (at most) the last max_bytes of a log file as text."""
+    with log_path.open("rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - max_bytes))
+        return f.read().decode("utf-8", errors="replace")
+
+
+def scan_log(log_text: str) -> Set[str]:
+    """
+    Return every step marker and error keyword present in the log.
+
+    All patterns are matched by one compiled alternation, so the log is
+    walked once instead of once per marker/keyword. Results are lowercased.
+    """
+    return {m.group(0).lower() for m in _LOG_SCAN_RE.finditer(log_text)}
 
-def extract_last_error_line(log_text: str) -> str:
-    """Return the last line containing [ERROR] or [FATAL], or empty string."""
-    lines = log_text.splitlines()
-    for line in reversed(lines):
-        if "[ERROR]" in line or "[FATAL]" in line:
-            return line.strip()
-    return ""
 
+def detect_last_step(log_hits: Set[str]) -> int:
+    """Detect the highest step number that appears in the main.py log (see scan_log)."""
+    for step, marker in _STEP_ITEMS:
+        if marker in log_hits:
+            return step
+    return 0
 
-def categorize_error(log_text: str, error_line: str) -> str:
-    """Categorize the type of error based on log content."""
-    log_lower = log_text.lower()
+
+def extract_last_error_line(log_text: str) -> str:
+    """Return the last line containing [ERROR] or [FATAL], or empty string."""
+    idx = max(log_text.rfind("[ERROR]"), log_text.rfind("[FATAL]"))
+    if idx < 0:
+        return ""
+    # Treat "\r" as a line break too, like splitlines(): git and pip redraw
+    # progress lines with carriage returns.
+    start = max(log_text.rfind("\n", 0, idx), log_text.rfind("\r", 0, idx)) + 1
+    ends = [pos for pos in (log_text.find("\n", idx), log_text.find("\r", idx)) if pos != -1]
+    end = min(ends) if ends else len(log_text)
+    return log_text[start:end].strip()
+
+
+def categorize_error(log_hits: Set[str], error_line: str) -> str:
+    """Categorize the type of error based on log content (see scan_log)."""
     error_lower = error_line.lower()
     
-    if "timeout" in log_lower or "timeout" in error_lower:
+    if "timeout" in log_hits or "timeout" in error_lower:
         return "TIMEOUT"
-    elif "no github link found" in log_lower:
+    elif "no github link found" in log_hits:
         return "NO_GITHUB_LINK"
-    elif "git clone failed" in log_lower:
+    elif "git clone failed" in log_hits:
         return "CLONE_FAILED"
-    elif "typeerror" in log_lower and "list" in log_lower:
+    elif "typeerror" in log_hits and "list" in log_hits:
         return "PARSER_TYPE_ERROR"
-    elif "modulenotfounderror" in log_lower or "importerror" in log_lower:
+    elif "modulenotfounderror" in log_hits or "importerror" in log_hits:
         return "MISSING_DEPENDENCY"
     elif "pip install" in error_lower:
         return "INSTALL_FAILED"
     elif "virtual environment" in error_lower:
         return "VENV_FAILED"
-    elif "demo generation failed" in log_lower:
+    elif "demo generation failed" in log_hits:
         return "DEMO_GEN_FAILED"
     elif "network" in error_lower or "connection" in error_lower:
         return "NETWORK_ERROR"
@@ -98,18 +212,22 @@ def categorize_error(log_text: str, error_line: str) -> str:
         return "UNKNOWN"
 
 
-def get_venv_python() -> Path:
-    """Return the python executable path inside tmp/.venv_repro."""
+def paper_work_dir(index: int) -> Path:
+    """Return the private work directory (tmp/paper_NNN) used for one paper."""
+    return TMP_DIR / f"paper_{index:03d}"
+
+
+def get_venv_python(venv_dir: Path = VENV_DIR) -> Path:
+    """Return the python executable path inside the given venv (tmp/.venv_repro by default)."""
     if sys.platform.startswith("win"):
-        return VENV_DIR / "Scripts" / "python.exe"
-    return VENV_DIR / "bin" / "python"
+        return venv_dir / "Scripts" / "python.exe"
+    return venv_dir / "bin" / "python"
 
 
 def extract_repo_name(log_text: str) -> Optional[str]:
     """Extract repository name from log if available."""
-    import re
     # Look for the actual repo name, not just "repo"
-    match = re.search(r"Repository successfully cloned into: .*?/([^/\n]+)(?:\s|$)", log_text)
+    match = _REPO_NAME_RE.search(log_text)
     if match:
         name = match.group(1).strip()
         # Filter out the partial matches
@@ -118,50 +236,162 @@ def extract_repo_name(log_text: str) -> Optional[str]:
     return None
 
 
-def cleanup_tmp_directory():
-    """Clean up tmp/ directory between runs."""
-    if TMP_DIR.exists():
+def cleanup_tmp_directory(path: Path = TMP_DIR):
+    """Clean up a tmp/ work directory between runs."""
+    if path.exists():
         try:
-            shutil.rmtree(TMP_DIR)
-            print(f"  [CLEANUP] Removed tmp/ directory")
+            fast_rmtree(path)
+            print(f"  [CLEANUP] Removed {path.relative_to(ROOT)}/ directory")
         except Exception as e:
-            print(f"  [WARNING] Could not fully clean tmp/: {e}")
+            print(f"  [WARNING] Could not fully clean {path.relative_to(ROOT)}/: {e}")
+
+
+def pipeline_env() -> Dict[str, str]:
+    """
+    Environment for main.py runs: every paper's pip shares one download/wheel
+    cache and the local wheelhouse, and prefers wheels over source builds.
+    """
+    return {
+        **os.environ,
+        "PIP_CACHE_DIR": str(PIP_CACHE_DIR),
+        "PIP_FIND_LINKS": str(WHEELHOUSE_DIR),
+        "PIP_PREFER_BINARY": "1",
+        "PIP_DISABLE_PIP_VERSION_CHECK": "1",
+        "PIP_NO_INPUT": "1",
+    }
 
 
-def run_main_for_url(url: str, index: int, total: int) -> Dict[str, Any]:
+def _pipeline_worker(argv: List[str], log_path: str, env: Dict[str, str]) -> None:
+    """
+    Entry point of a forked pipeline worker: runs main.run() in-process with
+    stdout/stderr (including those of pip/git children) going to log_path.
+    """
+    if os.name != "nt":
+        os.setsid()
+    os.chdir(ROOT)
+    os.environ.clear()
+    os.environ.update(env)
+
+    fd = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    os.dup2(fd, 1)
+    os.dup2(fd, 2)
+    os.close(fd)
+    sys.stdout.reconfigure(line_buffering=True)
+    sys.stderr.reconfigure(line_buffering=True)
+
+    import main as pipeline_main
+    sys.exit(pipeline_main.main(argv))
+
+
+def _worker_context() -> Optional[multiprocessing.context.BaseContext]:
+    """
+    Forkserver context with main.py and its imports preloaded, so each paper
+    forks a warm interpreter instead of paying interpreter + import startup.
+    Returns None where forkserver is unavailable (Windows).
+    """
+    global _WORKER_CONTEXT
+    if _WORKER_CONTEXT is None and "forkserver" in multiprocessing.get_all_start_methods():
+        _WORKER_CONTEXT = multiprocessing.get_context("forkserver")
+        _WORKER_CONTEXT.set_forkserver_preload(
+            ["main", "paper_extracter", "requirements_extract", "venv_create", "demo_creator"]
+        )
+    return _WORKER_CONTEXT
+
+
+_WORKER_CONTEXT: Optional[multiprocessing.context.BaseContext] = None
+
+
+async def wait_for_sentinel(sentinel: int) -> None:
+    """
+    Wait until a multiprocessing.Process sentinel becomes readable (the
+    process exited), on the event loop itself rather than a pool thread
+    that could be queued behind other blocking work.
+    """
+    loop = asyncio.get_running_loop()
+    exited = loop.create_future()
+    loop.add_reader(sentinel, lambda: exited.done() or exited.set_result(None))
+    try:
+        await exited
+    finally:
+        loop.remove_reader(sentinel)
+
+
+async def run_pipeline_worker(argv: List[str], log_path: Path, timeout: int) -> Tuple[int, bool]:
+    """
+    Run main.py's pipeline in a preloaded worker process.
+
+    Returns (exit code, timed_out); a worker killed by a signal has a
+    negative exit code either way, so only timed_out marks a timeout.
+    """
+    proc = _worker_context().Process(target=_pipeline_worker, args=(argv, str(log_path), pipeline_env()))
+    proc.start()
+    try:
+        await asyncio.wait_for(wait_for_sentinel(proc.sentinel), timeout)
+        proc.join()
+        return proc.exitcode, False
+    except asyncio.TimeoutError:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        await wait_for_sentinel(proc.sentinel)
+        proc.join()
+        with log_path.open("ab") as log_fp:
+            log_fp.write(f"\nTIMEOUT after {timeout}s\n".encode())
+        return proc.exitcode, True
+
+
+async def run_main_for_url(url: str, index: int, total: int, work_dir: Path) -> Dict[str, Any]:
     """
     Run main.py WITHOUT cleanup flags, so we can inspect demo afterwards.
+
+    Each paper gets its own work_dir so concurrent runs don't share tmp/repo
+    or tmp/.venv_repro.
     """
     LOG_DIR.mkdir(parents=True, exist_ok=True)
     log_path = LOG_DIR / f"log_{index:03d}.txt"
 
-    cmd = [sys.executable, str(MAIN_SCRIPT), url, "--tmp"]
+    argv = [url, "--work-dir", str(work_dir)]
     
     print(f"\n{'='*70}")
     print(f"[{index:03d}/{total:03d}] Processing Paper")
     print(f"{'='*70}")
     print(f"URL: {url}")
     print(f"Log: {log_path.relative_to(ROOT)}")
+    print(f"Work dir: {work_dir.relative_to(ROOT)}")
     print(f"Timeout: {PIPELINE_TIMEOUT}s")
     print(f"{'='*70}")
 
     start_time = time.time()
-    result = run_subprocess(cmd, cwd=ROOT, timeout=PIPELINE_TIMEOUT)
+    if _worker_context() is not None:
+        returncode, timed_out = await run_pipeline_worker(argv, log_path, PIPELINE_TIMEOUT)
+    else:
+        with log_path.open("wb") as log_fp:
+            result, timed_out = await run_subprocess_async(
+                [sys.executable, str(MAIN_SCRIPT), *argv],
+                cwd=ROOT, timeout=PIPELINE_TIMEOUT, log_fp=log_fp, env=pipeline_env()
+            )
+        returncode = result.returncode
     duration = time.time() - start_time
 
-    combined_log = result.stdout + "\n" + result.stderr
-    log_path.write_text(combined_log, encoding="utf-8")
+    log_text = log_path.read_text(encoding="utf-8", errors="replace")
+
+    pipeline_ok = (returncode == 0)
 
-    last_step = detect_last_step(combined_log)
-    error_line = extract_last_error_line(combined_log)
-    error_category = categorize_error(combined_log, error_line)
-    repo_name = extract_repo_name(combined_log)
+    log_hits = scan_log(log_text)
+    last_step = detect_last_step(log_hits)
+    repo_name = extract_repo_name(log_text)
+    del log_text
 
-    pipeline_ok = (result.returncode == 0)
-    timed_out = ("TIMEOUT" in combined_log)
+    # A successful run has nothing to categorize; skip the error-line search
+    if pipeline_ok:
+        error_line, error_category = "", "NONE"
+    else:
+        error_line = extract_last_error_line(read_log_tail(log_path))
+        error_category = categorize_error(log_hits, error_line)
 
-    print(f"✓ Pipeline completed in {duration:.1f}s")
-    print(f"  Return code: {result.returncode}")
+    print(f"[{index:03d}] ✓ Pipeline completed in {duration:.1f}s")
+    print(f"  Return code: {returncode}")
     print(f"  Last step: {last_step} ({STEP_NAMES.get(last_step, 'Unknown')})")
     if error_category != "UNKNOWN":
         print(f"  Error type: {error_category}")
@@ -171,7 +401,7 @@ def run_main_for_url(url: str, index: int, total: int) -> Dict[str, Any]:
     return {
         "url": url,
         "index": index,
-        "pipeline_rc": result.returncode,
+        "pipeline_rc": returncode,
         "pipeline_ok": pipeline_ok,
         "pipeline_timeout": timed_out,
         "pipeline_duration": round(duration, 2),
@@ -184,12 +414,29 @@ def run_main_for_url(url: str, index: int, total: int) -> Dict[str, Any]:
     }
 
 
-def run_generated_demo() -> Dict[str, Any]:
+def empty_demo_result() -> Dict[str, Any]:
+    """Demo columns for a paper whose demo was never run."""
+    return {
+        "demo_exists": False,
+        "venv_python_exists": False,
+        "demo_rc": None,
+        "demo_ok": False,
+        "demo_duration": 0.0,
+        "demo_timeout": False,
+        "demo_error_summary": "",
+        "demo_error_type": "",
+    }
+
+
+async def run_generated_demo(index: int, work_dir: Path = TMP_DIR) -> Dict[str, Any]:
     """
-    Run tmp/repo/generated_demo.py using tmp/.venv_repro python, if present.
+    Run <work_dir>/repo/generated_demo.py using <work_dir>/.venv_repro python, if present.
+
+    Demo output is streamed to batch_logs/demo_NNN.txt.
     """
-    demo_path = REPO_DIR / DEMO_FILENAME
-    venv_python = get_venv_python()
+    demo_path = work_dir / REPO_DIR.name / DEMO_FILENAME
+    log_path = LOG_DIR / f"demo_{index:03d}.txt"
+    venv_python = get_venv_python(work_dir / VENV_DIR.name)
 
     result: Dict[str, Any] = {
         "demo_exists": demo_path.is_file(),
@@ -214,24 +461,22 @@ def run_generated_demo() -> Dict[str, Any]:
     print(f"  [DEMO] Running: {DEMO_FILENAME}")
 
     start_time = time.time()
-    proc = run_subprocess(cmd, cwd=demo_path.parent, timeout=DEMO_TIMEOUT)
+    with log_path.open("wb") as log_fp:
+        proc, timed_out = await run_subprocess_async(cmd, cwd=demo_path.parent, timeout=DEMO_TIMEOUT, log_fp=log_fp)
     duration = time.time() - start_time
 
     result["demo_rc"] = proc.returncode
     result["demo_ok"] = (proc.returncode == 0)
     result["demo_duration"] = round(duration, 2)
-    result["demo_timeout"] = proc.returncode == -1
+    result["demo_timeout"] = timed_out
 
     if not result["demo_ok"]:
-        stderr = proc.stderr.strip()
-        stdout = proc.stdout.strip()
-        summary = stderr or stdout
+        summary = read_log_tail(log_path).strip()
         
         if "ModuleNotFoundError" in summary:
             result["demo_error_type"] = "MISSING_MODULE"
             # Extract module name if possible
-            import re
-            match = re.search(r"No module named ['\"]([^'\"]+)['\"]", summary)
+            match = _MISSING_MODULE_RE.search(summary)
             if match:
                 print(f"  [DEMO] Missing module: {match.group(1)}")
         elif "ImportError" in summary:
@@ -240,16 +485,23 @@ def run_generated_demo() -> Dict[str, Any]:
             result["demo_error_type"] = "TIMEOUT"
         elif summary:
             result["demo_error_type"] = "RUNTIME_ERROR"
-            # Show first line of error for quick diagnosis
-            first_error_line = summary.split('\n')[0] if '\n' in summary else summary[:100]
-            print(f"  [DEMO] Error: {first_error_line}")
+            # Show last line of output (the exception, for a traceback) for quick diagnosis
+            last_error_line = summary.rsplit('\n', 1)[-1][:100]
+            print(f"  [DEMO] Error: {last_error_line}")
         else:
             result["demo_error_type"] = "UNKNOWN"
         
+        # Keep the end of the output, where the traceback is
         if len(summary) > 500:
-            summary = summary[:500] + "... [truncated]"
+            summary = "[truncated] ..." + summary[-500:]
         result["demo_error_summary"] = summary
 
+        # main.py only evicts failing demos under --auto-run; drop this one
+        # here so the next batch asks the LLM again instead of replaying it
+        from demo_creator import discard_cached_demo_file
+        if discard_cached_demo_file(demo_path):
+            print("  [DEMO] Removed failing demo from the demo cache")
+
     status = "✓ SUCCESS" if result["demo_ok"] else "✗ FAILED"
     print(f"  [DEMO] Completed in {duration:.1f}s - {status}")
     if not result["demo_ok"] and result["demo_error_type"]:
@@ -258,80 +510,138 @@ def run_generated_demo() -> Dict[str, Any]:
     return result
 
 
-def write_results_csv(rows: List[Dict[str, Any]]) -> None:
-    """Write all results into a CSV file."""
-    import csv
-
-    RESULTS_CSV.parent.mkdir(parents=True, exist_ok=True)
-
-    fieldnames = [
-        "index",
-        "url",
-        "pipeline_rc",
-        "pipeline_ok",
-        "pipeline_timeout",
-        "pipeline_duration",
-        "last_step",
-        "last_step_name",
-        "error_category",
-        "pipeline_error",
-        "repo_name",
-        "log_path",
-        "demo_exists",
-        "venv_python_exists",
-        "demo_rc",
-        "demo_ok",
-        "demo_timeout",
-        "demo_duration",
-        "demo_error_type",
-        "demo_error_summary",
-    ]
-
-    with RESULTS_CSV.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
-
-    print(f"\n✓ CSV results written to: {RESULTS_CSV.relative_to(ROOT)}")
-
-
-def write_results_json(rows: List[Dict[str, Any]], metadata: Dict[str, Any]) -> None:
-    """Write results and metadata to JSON."""
-    output = {
-        "metadata": metadata,
-        "results": rows,
-    }
-    
-    with RESULTS_JSON.open("w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2)
-    
-    print(f"✓ JSON results written to: {RESULTS_JSON.relative_to(ROOT)}")
+CSV_FIELDNAMES = [
+    "index",
+    "url",
+    "pipeline_rc",
+    "pipeline_ok",
+    "pipeline_timeout",
+    "pipeline_duration",
+    "last_step",
+    "last_step_name",
+    "error_category",
+    "pipeline_error",
+    "repo_name",
+    "log_path",
+    "demo_exists",
+    "venv_python_exists",
+    "demo_rc",
+    "demo_ok",
+    "demo_timeout",
+    "demo_duration",
+    "demo_error_type",
+    "demo_error_summary",
+]
+
+_INT_FIELDS = {"index", "pipeline_rc", "last_step", "demo_rc"}
+_FLOAT_FIELDS = {"pipeline_duration", "demo_duration"}
+_BOOL_FIELDS = {"pipeline_ok", "pipeline_timeout", "demo_exists", "venv_python_exists", "demo_ok", "demo_timeout"}
+
+
+def load_previous_results() -> List[Dict[str, Any]]:
+    """Read rows from an existing results CSV, restoring their value types."""
+    if not RESULTS_CSV.is_file():
+        return []
+
+    rows: List[Dict[str, Any]] = []
+    with RESULTS_CSV.open("r", newline="", encoding="utf-8") as f:
+        for raw in csv.DictReader(f):
+            row: Dict[str, Any] = {}
+            for key in CSV_FIELDNAMES:
+                value = raw.get(key) or ""
+                if key in _INT_FIELDS:
+                    row[key] = int(value) if value else None
+                elif key in _FLOAT_FIELDS:
+                    row[key] = float(value) if value else 0.0
+                elif key in _BOOL_FIELDS:
+                    row[key] = (value == "True")
+                else:
+                    row[key] = value
+            if row["index"] is not None:
+                rows.append(row)
+    return rows
+
+
+class ResultsWriter:
+    """
+    Writes result rows to RESULTS_CSV and RESULTS_JSON as soon as each paper
+    finishes, so an interrupted batch keeps everything processed so far.
+    """
+
+    def __init__(self, previous_rows: Optional[List[Dict[str, Any]]] = None) -> None:
+        RESULTS_CSV.parent.mkdir(parents=True, exist_ok=True)
+        previous_rows = previous_rows or []
+
+        # On resume, append to the existing CSV; otherwise start fresh
+        append = bool(previous_rows)
+        self._csv_file = RESULTS_CSV.open("a" if append else "w", newline="", encoding="utf-8")
+        self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=CSV_FIELDNAMES)
+        if not append:
+            self._csv_writer.writeheader()
+            self._csv_file.flush()
+
+        # JSON is streamed as {"results": [row, row, ...], "metadata": {...}}
+        self._json_file = RESULTS_JSON.open("wb")
+        self._json_file.write(b'{\n  "results": [')
+        self._json_rows = 0
+        for row in previous_rows:
+            self._write_json_row(row)
+        self._json_file.flush()
+
+    def write_row(self, row: Dict[str, Any]) -> None:
+        """Append one result row to both files and flush it to disk."""
+        self._csv_writer.writerow(row)
+        self._csv_file.flush()
+        os.fsync(self._csv_file.fileno())
+
+        self._write_json_row(row)
+        self._json_file.flush()
+
+    def _write_json_row(self, row: Dict[str, Any]) -> None:
+        separator = b"," if self._json_rows else b""
+        self._json_file.write(separator + b"\n    " + json_dumps(row))
+        self._json_rows += 1
+
+    def close(self, metadata: Dict[str, Any]) -> None:
+        """Finish the JSON document with the run metadata and close both files."""
+        self._csv_file.close()
+        print(f"\n✓ CSV results written to: {RESULTS_CSV.relative_to(ROOT)}")
+
+        self._json_file.write(b'\n  ],\n  "metadata": ')
+        self._json_file.write(json_dumps(metadata, indent=True).replace(b"\n", b"\n  "))
+        self._json_file.write(b"\n}\n")
+        self._json_file.close()
+        print(f"✓ JSON results written to: {RESULTS_JSON.relative_to(ROOT)}")
 
 
 def write_summary_report(rows: List[Dict[str, Any]], metadata: Dict[str, Any]) -> None:
     """Write a human-readable summary report."""
     total = len(rows)
-    pipeline_success = sum(1 for r in rows if r["pipeline_ok"])
-    demo_generated = sum(1 for r in rows if r["demo_exists"])
-    demo_success = sum(1 for r in rows if r["demo_ok"])
-    
-    step_counts = {}
-    for r in rows:
-        step = r["last_step"]
-        step_counts[step] = step_counts.get(step, 0) + 1
-    
-    error_counts = {}
-    for r in rows:
-        if not r["pipeline_ok"]:
-            cat = r["error_category"]
-            error_counts[cat] = error_counts.get(cat, 0) + 1
-    
-    demo_error_counts = {}
+    pipeline_success = demo_generated = demo_success = 0
+    step_counts: Counter = Counter()
+    error_counts: Counter = Counter()
+    demo_error_counts: Counter = Counter()
+    successful_demos: List[Dict[str, Any]] = []
+    failed_demos: List[Dict[str, Any]] = []
+    failed_pipelines: List[Dict[str, Any]] = []
+
     for r in rows:
-        if not r["demo_ok"] and r["demo_error_type"]:
-            typ = r["demo_error_type"]
-            demo_error_counts[typ] = demo_error_counts.get(typ, 0) + 1
+        step_counts[r["last_step"]] += 1
+        if r["pipeline_ok"]:
+            pipeline_success += 1
+        else:
+            error_counts[r["error_category"]] += 1
+            failed_pipelines.append(r)
+        if r["demo_exists"]:
+            demo_generated += 1
+        if r["demo_ok"]:
+            demo_success += 1
+            successful_demos.append(r)
+        else:
+            if r["demo_error_type"]:
+                demo_error_counts[r["demo_error_type"]] += 1
+            if r["demo_exists"]:
+                failed_demos.append(r)
     
     report = textwrap.dedent(f"""
     {'='*70}
@@ -369,7 +679,7 @@ def write_summary_report(rows: List[Dict[str, Any]], metadata: Dict[str, Any]) -
     {'='*70}
     
     """)
-        for cat, count in sorted(error_counts.items(), key=lambda x: -x[1]):
+        for cat, count in error_counts.most_common():
             report += f"  {cat:25s}: {count:3d}\n"
     
     if demo_error_counts:
@@ -380,11 +690,10 @@ def write_summary_report(rows: List[Dict[str, Any]], metadata: Dict[str, Any]) -
     {'='*70}
     
     """)
-        for typ, count in sorted(demo_error_counts.items(), key=lambda x: -x[1]):
+        for typ, count in demo_error_counts.most_common():
             report += f"  {typ:25s}: {count:3d}\n"
     
     # Show successful demos for inspection
-    successful_demos = [r for r in rows if r["demo_ok"]]
     if successful_demos:
         report += textwrap.dedent(f"""
     
@@ -400,7 +709,6 @@ def write_summary_report(rows: List[Dict[str, Any]], metadata: Dict[str, Any]) -
             report += "\n"
     
     # Show detailed demo failures
-    failed_demos = [r for r in rows if r["demo_exists"] and not r["demo_ok"]]
     if failed_demos:
         report += textwrap.dedent(f"""
     
@@ -414,11 +722,10 @@ def write_summary_report(rows: List[Dict[str, Any]], metadata: Dict[str, Any]) -
             report += f"       Repo: {r['repo_name'] or 'Unknown'}\n"
             report += f"       URL: {r['url']}\n"
             if r['demo_error_summary']:
-                preview = r['demo_error_summary'].split('\n')[0][:100]
+                preview = r['demo_error_summary'].rsplit('\n', 1)[-1][:100]
                 report += f"       Error: {preview}\n"
             report += "\n"
     
-    failed_pipelines = [r for r in rows if not r["pipeline_ok"]]
     if failed_pipelines:
         report += textwrap.dedent(f"""
     
@@ -447,7 +754,156 @@ def write_summary_report(rows: List[Dict[str, Any]], metadata: Dict[str, Any]) -
 
 
 
+def skipped_paper_result(url: str, index: int, step_name: str, category: str, error: str) -> Dict[str, Any]:
+    """Result row for a paper whose pipeline never ran to completion."""
+    return {
+        "url": url,
+        "index": index,
+        "pipeline_rc": -999,
+        "pipeline_ok": False,
+        "pipeline_timeout": False,
+        "pipeline_duration": 0.0,
+        "last_step": 0,
+        "last_step_name": step_name,
+        "error_category": category,
+        "pipeline_error": error,
+        "repo_name": "",
+        "log_path": "",
+        **empty_demo_result(),
+    }
+
+
+def check_url(url: str) -> Optional[str]:
+    """
+    Return None if the URL answers with a non-error status, else the reason.
+
+    Tries HEAD first and falls back to a one-byte ranged GET for servers that
+    don't support HEAD.
+    """
+    headers = {"User-Agent": "Repoduce-Me batch_eval"}
+    reason = ""
+    for method, extra in (("HEAD", {}), ("GET", {"Range": "bytes=0-0"})):
+        request = urllib.request.Request(url, method=method, headers={**headers, **extra})
+        try:
+            with urllib.request.urlopen(request, timeout=PREFLIGHT_TIMEOUT) as response:
+                if response.status is None or response.status < 400:
+                    return None
+                reason = f"HTTP {response.status}"
+        except urllib.error.HTTPError as e:
+            reason = f"HTTP {e.code}"
+            if e.code not in (403, 405, 501):
+                break
+        except Exception as e:
+            reason = f"{type(e).__name__}: {e}"
+            break
+    return reason
+
+
+async def preflight_urls(urls: List[str]) -> Dict[str, str]:
+    """Check all paper URLs concurrently; return {url: reason} for unreachable ones."""
+    sem = asyncio.Semaphore(PREFLIGHT_CONCURRENCY)
+
+    async def check(url: str) -> Optional[str]:
+        async with sem:
+            return await asyncio.to_thread(check_url, url)
+
+    reasons = await asyncio.gather(*(check(url) for url in urls))
+    return {url: reason for url, reason in zip(urls, reasons) if reason is not None}
+
+
+async def process_paper(url: str, index: int, total: int) -> Dict[str, Any]:
+    """Run the pipeline and then the generated demo for a single paper."""
+    work_dir = paper_work_dir(index)
+    try:
+        # Clean this paper's work dir before the run for a fresh start
+        cleanup_tmp_directory(work_dir)
+
+        # 1) Run the main pipeline (without cleanup)
+        main_res = await run_main_for_url(url, index, total, work_dir)
+
+        # 2) If pipeline succeeded, try running generated_demo.py
+        demo_res: Dict[str, Any]
+        if main_res["pipeline_ok"]:
+            demo_res = await run_generated_demo(index, work_dir)
+        else:
+            demo_res = empty_demo_result()
+
+        # Clean up after demo check
+        cleanup_tmp_directory(work_dir)
+
+        return {**main_res, **demo_res}
+
+    except Exception as e:
+        print(f"\n[CRITICAL ERROR] Failed to process URL {index}: {e}")
+        traceback.print_exc()
+        return skipped_paper_result(url, index, "CRASH", "BATCH_RUNNER_ERROR", str(e))
+
+
+async def main_async(
+    results: List[Dict[str, Any]],
+    writer: ResultsWriter,
+    skip_indices: Set[int],
+    preflight: bool = True,
+) -> None:
+    """
+    Process all papers concurrently, at most BATCH_CONCURRENCY at a time.
+
+    Rows are appended to `results` and written out as papers finish, so
+    partial results survive a crash or Ctrl-C. With preflight, unreachable
+    URLs are recorded as URL_UNREACHABLE without running the pipeline.
+    """
+    sem = asyncio.Semaphore(BATCH_CONCURRENCY)
+    total = len(PAPER_URLS)
+
+    pending = [(idx, url) for idx, url in enumerate(PAPER_URLS, start=1) if idx not in skip_indices]
+
+    unreachable: Dict[str, str] = {}
+    if preflight:
+        print(f"[PREFLIGHT] Checking {len(pending)} paper URLs...")
+        unreachable = await preflight_urls([url for _, url in pending])
+        for url, reason in unreachable.items():
+            print(f"[PREFLIGHT] Unreachable, skipping: {url} ({reason})")
+
+    async def bounded(url: str, idx: int) -> None:
+        if url in unreachable:
+            row = skipped_paper_result(url, idx, "URL unreachable", "URL_UNREACHABLE", unreachable[url])
+        else:
+            async with sem:
+                row = await process_paper(url, idx, total)
+        results.append(row)
+        writer.write_row(row)
+
+        # Print concise progress
+        demo_status = '✓' if row['demo_ok'] else ('✗' if row['demo_exists'] else '-')
+        print(f"\n[PROGRESS] {len(results)}/{total} complete - "
+              f"[{idx:03d}] Pipeline: {'✓' if row['pipeline_ok'] else '✗'} "
+              f"Demo: {demo_status}")
+
+    tasks = [bounded(url, idx) for idx, url in pending]
+    outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+
+    # A paper whose row couldn't be written (e.g. disk full) must not vanish silently
+    for (idx, url), outcome in zip(pending, outcomes):
+        if isinstance(outcome, BaseException):
+            print(f"\n[ERROR] Recording paper {idx:03d} ({url}) failed: "
+                  f"{type(outcome).__name__}: {outcome}")
+            traceback.print_exception(type(outcome), outcome, outcome.__traceback__)
+
+
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Batch evaluation runner for the Repoduce-Me pipeline.")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=f"Skip papers already recorded in {RESULTS_CSV.name} and append to it.",
+    )
+    parser.add_argument(
+        "--no-preflight",
+        action="store_true",
+        help="Don't check that paper URLs are reachable before processing them.",
+    )
+    args = parser.parse_args()
+
     start_time_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     start_time = time.time()
     
@@ -458,78 +914,32 @@ def main() -> None:
     Root Directory: {ROOT}
     Main Script:    {MAIN_SCRIPT}
     Papers:         {len(PAPER_URLS)}
+    Concurrency:    {BATCH_CONCURRENCY}
     Pipeline Timeout: {PIPELINE_TIMEOUT}s
     Demo Timeout:     {DEMO_TIMEOUT}s
     {'='*70}
     """))
 
-    results: List[Dict[str, Any]] = []
+    previous_rows = load_previous_results() if args.resume else []
+    skip_indices = {
+        r["index"] for r in previous_rows
+        if r["index"] <= len(PAPER_URLS) and PAPER_URLS[r["index"] - 1] == r["url"]
+    }
+    previous_rows = [r for r in previous_rows if r["index"] in skip_indices]
+    if args.resume:
+        print(f"[RESUME] Skipping {len(skip_indices)} papers already in {RESULTS_CSV.relative_to(ROOT)}")
+
+    WHEELHOUSE_DIR.mkdir(parents=True, exist_ok=True)
+
+    results: List[Dict[str, Any]] = list(previous_rows)
+    writer = ResultsWriter(previous_rows)
 
     try:
-        for idx, url in enumerate(PAPER_URLS, start=1):
-            try:
-                # Clean tmp/ before each run for fresh start
-                cleanup_tmp_directory()
-                
-                # 1) Run the main pipeline (without cleanup)
-                main_res = run_main_for_url(url, idx, len(PAPER_URLS))
-
-                # 2) If pipeline succeeded, try running generated_demo.py
-                demo_res: Dict[str, Any]
-                if main_res["pipeline_ok"]:
-                    demo_res = run_generated_demo()
-                else:
-                    demo_res = {
-                        "demo_exists": False,
-                        "venv_python_exists": False,
-                        "demo_rc": None,
-                        "demo_ok": False,
-                        "demo_duration": 0.0,
-                        "demo_timeout": False,
-                        "demo_error_summary": "",
-                        "demo_error_type": "",
-                    }
-
-                row = {**main_res, **demo_res}
-                results.append(row)
-
-                # Print concise progress
-                demo_status = '✓' if row['demo_ok'] else ('✗' if row['demo_exists'] else '-')
-                print(f"\n[PROGRESS] {idx}/{len(PAPER_URLS)} complete - "
-                      f"Pipeline: {'✓' if row['pipeline_ok'] else '✗'} "
-                      f"Demo: {demo_status}")
-                
-                # Clean up after demo check
-                cleanup_tmp_directory()
-
-            except Exception as e:
-                print(f"\n[CRITICAL ERROR] Failed to process URL {idx}: {e}")
-                traceback.print_exc()
-                results.append({
-                    "url": url,
-                    "index": idx,
-                    "pipeline_rc": -999,
-                    "pipeline_ok": False,
-                    "pipeline_timeout": False,
-                    "pipeline_duration": 0.0,
-                    "last_step": 0,
-                    "last_step_name": "CRASH",
-                    "error_category": "BATCH_RUNNER_ERROR",
-                    "pipeline_error": str(e),
-                    "repo_name": "",
-                    "log_path": "",
-                    "demo_exists": False,
-                    "venv_python_exists": False,
-                    "demo_rc": None,
-                    "demo_ok": False,
-                    "demo_duration": 0.0,
-                    "demo_timeout": False,
-                    "demo_error_summary": "",
-                    "demo_error_type": "",
-                })
+        asyncio.run(main_async(results, writer, skip_indices, preflight=not args.no_preflight))
 
     finally:
         total_duration = time.time() - start_time
+        results.sort(key=lambda r: r["index"])
         
         metadata = {
             "start_time": start_time_str,
@@ -537,12 +947,12 @@ def main() -> None:
             "total_duration": round(total_duration, 2),
             "total_papers": len(PAPER_URLS),
             "processed_papers": len(results),
+            "concurrency": BATCH_CONCURRENCY,
             "pipeline_timeout": PIPELINE_TIMEOUT,
             "demo_timeout": DEMO_TIMEOUT,
         }
         
-        write_results_csv(results)
-        write_results_json(results, metadata)
+        writer.close(metadata)
         write_summary_report(results, metadata)
 
 
@@ -11,6 +11,9 @@ python cleanup.py --workspace
 
 # Remove BOTH
 python cleanup.py --tmp --workspace
+
+# Remove the persistent caches (~/.repro_cache: cached papers, clones, venvs, demos and requirement locks)
+python cleanup.py --cache
 """
 
 import argparse
@@ -20,6 +23,7 @@ from pathlib import Path
 from constants import (
     TMP_DIR, 
     WORKSPACE_DIR, 
+    CACHE_ROOT,
 )
 
 def wipe(path: Path):
@@ -36,14 +40,18 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Cleanup utility for pipeline folders.")
     parser.add_argument("--tmp", action="store_true", help="Delete the tmp/ directory.")
     parser.add_argument("--workspace", action="store_true", help="Delete the workspace/ directory.")
+    parser.add_argument("--cache", action="store_true", help="Delete the persistent cache directory (~/.repro_cache).")
 
     args = parser.parse_args()
 
-    if not args.tmp and not args.workspace:
-        parser.error("No action specified — use --tmp and/or --workspace.")
+    if not args.tmp and not args.workspace and not args.cache:
+        parser.error("No action specified — use --tmp, --workspace and/or --cache.")
 
     if args.tmp:
         wipe(TMP_DIR)
 
     if args.workspace:
         wipe(WORKSPACE_DIR)
+
+    if args.cache:
+        wipe(CACHE_ROOT)
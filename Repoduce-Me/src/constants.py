@@ -1,6 +1,5 @@
 from __future__ import annotations
 from typing import List
-from math import random
 
 from pathlib import Path
 
@@ -27,6 +26,46 @@ SUMMARY_TXT = ROOT / "batch_summary.txt"
 PIPELINE_TIMEOUT = 600  
 DEMO_TIMEOUT = 120     
 
+# Number of papers processed concurrently by batch_eval.py
+BATCH_CONCURRENCY = 8
+
+# Reachability check of paper URLs before a batch starts
+PREFLIGHT_CONCURRENCY = 50
+PREFLIGHT_TIMEOUT = 10
+
+# --------------------------------- # 
+# persistent caches (shared across runs)
+# --------------------------------- # 
+
+CACHE_ROOT = Path.home() / ".repro_cache"
+CLONE_CACHE_DIR = CACHE_ROOT / "clones"
+CLONE_CACHE_MAX_BYTES = 20 * 1024 ** 3
+VENV_CACHE_DIR = CACHE_ROOT / "venvs"
+# Least-recently-used cached venvs beyond this count are evicted
+VENV_CACHE_MAX_ENTRIES = 8
+# Template venvs with build tools + common preinstalls, copied for cache misses
+BASE_VENV_DIR = CACHE_ROOT / "base_venvs"
+PAPER_CACHE_DIR = CACHE_ROOT / "papers"
+# Generated demo scripts, keyed by the LLM prompt they were generated from
+DEMO_CACHE_DIR = CACHE_ROOT / "demos"
+PIP_CACHE_DIR = CACHE_ROOT / "pip"
+# uv keeps its own cache format, so it gets its own directory
+UV_CACHE_DIR = CACHE_ROOT / "uv"
+# Fully pinned requirements compiled by `uv pip compile`, keyed by the
+# requirements file's contents and the target interpreter
+LOCK_CACHE_DIR = CACHE_ROOT / "locks"
+# Older locks are recompiled, so unpinned requirements pick up new releases
+LOCK_MAX_AGE = 7 * 24 * 3600
+# Extra wheels dropped here are picked up by pip in batch runs (--find-links)
+WHEELHOUSE_DIR = CACHE_ROOT / "wheelhouse"
+
+CLONE_TIMEOUT = 300
+# Parallel submodule fetches per clone
+GIT_JOBS = 8
+
+# Threads used to delete one directory tree in the background (utils.fast_rmtree)
+RMTREE_WORKERS = 8
+
 
 
 ALL_PAPER_URLS: List[str] = [
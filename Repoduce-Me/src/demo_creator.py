@@ -7,12 +7,46 @@ from a cloned repository, primarily based on its README and examples.
 
 from __future__ import annotations
 
+import hashlib
+import os
 import re
+import uuid
 from pathlib import Path
 from typing import Optional, Set, List, Any
 
+from constants import DEMO_CACHE_DIR
 from constructor_model import ConstructorModel
 
+LLM_MODEL = "gpt-5.1"
+
+
+def discard_cached_demo_file(demo_path: Path) -> bool:
+    """
+    Drops the cache entry a generated demo was written from, matched by
+    content. For callers that run the demo without the DemoCreator that
+    produced it (batch_eval runs main.py in a separate process). Returns
+    True if an entry was removed.
+    """
+    try:
+        code = Path(demo_path).read_bytes()
+        entries = os.scandir(DEMO_CACHE_DIR)
+    except OSError:
+        return False
+
+    removed = False
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith(".py"):
+                continue
+            try:
+                # Size first, so only same-length entries are read
+                if entry.stat().st_size == len(code) and Path(entry.path).read_bytes() == code:
+                    os.unlink(entry.path)
+                    removed = True
+            except OSError:
+                continue
+    return removed
+
 
 class DemoCreator:
     """
@@ -26,6 +60,7 @@ class DemoCreator:
         output_filename: str = "generated_demo.py",
         max_readme_chars: Any = 8000,
         installed_packages: Any = None,
+        use_cache: bool = True,
     ) -> None:
         """
         Initialize DemoCreator.
@@ -35,6 +70,9 @@ class DemoCreator:
             output_filename: Name of the output demo file.
             max_readme_chars: Maximum characters to read from README.
             installed_packages: Set/list of installed package names.
+            use_cache: Reuse a demo previously generated from an identical
+                prompt (README, examples and installed packages) instead
+                of calling the LLM again.
         """
         self.repo_path = Path(repo_path).resolve()
         self.output_path = self.repo_path / str(output_filename)
@@ -46,6 +84,9 @@ class DemoCreator:
         
         self.installed_packages: Set[str] = self._normalize_packages(installed_packages)
 
+        self.use_cache = use_cache
+        self._cache_path: Optional[Path] = None
+
         self._llm: Optional[ConstructorModel] = None
 
     def _normalize_packages(self, packages: Any) -> Set[str]:
@@ -71,7 +112,7 @@ class DemoCreator:
     def llm(self) -> ConstructorModel:
         """Lazy initialization of the LLM."""
         if self._llm is None:
-            self._llm = ConstructorModel(model="gpt-5.1")
+            self._llm = ConstructorModel(model=LLM_MODEL)
         return self._llm
 
 
@@ -103,20 +144,27 @@ class DemoCreator:
 
         prompt = self._build_prompt(readme_text, example_snippets)
 
-        print("[INFO] Calling Constructor LLM to generate demo code...")
-        try:
-            response = self.llm.invoke(prompt)
-        except Exception as e:
-            print(f"[ERROR] LLM invocation failed: {type(e).__name__} - {e}")
-            print("=== DEMO GENERATION: FAILED DURING LLM CALL ===")
-            return None
-
-        raw_response = getattr(response, "content", str(response))
-        demo_code = self._extract_code(raw_response)
-        if not demo_code or len(demo_code.strip()) == 0:
-            print("[ERROR] LLM response did not contain any recognizable Python code.")
-            print("=== DEMO GENERATION: FAILED (EMPTY CODE) ===")
-            return None
+        demo_code = self._load_cached_demo(prompt) if self.use_cache else None
+        if demo_code is not None:
+            print(f"[CACHE] Reusing demo generated from an identical prompt: {self._cache_path}")
+        else:
+            print("[INFO] Calling Constructor LLM to generate demo code...")
+            try:
+                response = self.llm.invoke(prompt)
+            except Exception as e:
+                print(f"[ERROR] LLM invocation failed: {type(e).__name__} - {e}")
+                print("=== DEMO GENERATION: FAILED DURING LLM CALL ===")
+                return None
+
+            raw_response = getattr(response, "content", str(response))
+            demo_code = self._extract_code(raw_response)
+            if not demo_code or len(demo_code.strip()) == 0:
+                print("[ERROR] LLM response did not contain any recognizable Python code.")
+                print("=== DEMO GENERATION: FAILED (EMPTY CODE) ===")
+                return None
+
+            if self.use_cache:
+                self._store_cached_demo(demo_code)
 
         try:
             self._write_demo(demo_code)
@@ -130,6 +178,33 @@ class DemoCreator:
         return self.output_path
 
 
+    def _load_cached_demo(self, prompt: str) -> Optional[str]:
+        """Returns the demo cached for this prompt, if any, and remembers its cache path."""
+        key = hashlib.blake2b(f"{LLM_MODEL}\n{prompt}".encode("utf-8"), digest_size=16).hexdigest()
+        self._cache_path = DEMO_CACHE_DIR / f"{key}.py"
+        try:
+            return self._cache_path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def _store_cached_demo(self, code: str) -> None:
+        """Saves generated code under the prompt's cache path (temp file + os.replace)."""
+        if self._cache_path is None:
+            return
+        tmp = self._cache_path.with_name(f"{self._cache_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            DEMO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(code, encoding="utf-8")
+            os.replace(tmp, self._cache_path)
+        except OSError as e:
+            print(f"[WARNING] Could not cache generated demo: {e}")
+            tmp.unlink(missing_ok=True)
+
+    def discard_cached_demo(self) -> None:
+        """Drops the cached demo for the last prompt, e.g. after it failed to run."""
+        if self._cache_path is not None:
+            self._cache_path.unlink(missing_ok=True)
+
     def _load_readme(self) -> Optional[str]:
         """
         Finds and loads README.* in repo root. Returns truncated content.
@@ -182,12 +257,17 @@ class DemoCreator:
         MAX_TOTAL_SIZE: int = 12000
 
         for d in candidate_dirs:
-            if not d.is_dir():
-                continue
-
+            # One scandir per directory; the entries' cached type and size
+            # rule out directories and oversized files without reading them
             try:
-                py_files = list(sorted(d.glob("*.py")))
-            except Exception:
+                with os.scandir(d) as entries:
+                    py_files = sorted(
+                        Path(entry.path) for entry in entries
+                        if entry.name.endswith(".py")
+                        and entry.is_file()
+                        and entry.stat().st_size <= MAX_FILE_SIZE
+                    )
+            except OSError:
                 continue
 
             for py_file in py_files:
@@ -1,12 +1,102 @@
+import asyncio
+import gzip
+import importlib.util
 import os
+import random
+import re
 import shutil
 import subprocess
 import time
 import stat
-from typing import Optional
+import tarfile
+import tempfile
+import sys
+import threading
+import hashlib
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Iterable, List, Optional, TypeVar
 import urllib.request
 from pathlib import Path
 
+from utils import CLOSE_FDS, GIT, cache_entry_lock, fast_rmtree
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# httpx only speaks HTTP/2 when the optional h2 package is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+from constants import (
+    CLONE_CACHE_DIR,
+    CLONE_CACHE_MAX_BYTES,
+    CLONE_TIMEOUT,
+    GIT_JOBS,
+)
+
+T = TypeVar("T")
+
+# Lines of git stderr kept for error reports
+GIT_STDERR_TAIL_LINES = 200
+
+# Upper bound on a single retry backoff, before jitter
+RETRY_MAX_DELAY = 30.0
+
+# 1 MiB reads/writes for PDF bodies instead of copyfileobj's 64 KiB default
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+DOWNLOAD_TIMEOUT = 30.0
+# httpx sends its own Accept-Encoding and decodes transparently; these are for urllib
+DOWNLOAD_HEADERS = {"Accept-Encoding": "gzip, identity", "User-Agent": "repoduce-me/1.0"}
+
+# Uncached shallow clones of GitHub repos are fetched as a source tarball:
+# one HTTP GET, no pack negotiation or checkout
+GITHUB_REPO_RE = re.compile(r"^https?://github\.com/([^/\s]+)/([^/\s]+?)(?:\.git)?/?$")
+GITHUB_ARCHIVE_URL = "https://codeload.github.com/{owner}/{repo}/tar.gz/{ref}"
+
+
+@contextmanager
+def atomic_output(output_path: str, expected_size: Optional[int] = None):
+    """
+    Yields an unbuffered binary file that replaces output_path only once
+    the block completes, so an interrupted download never leaves a
+    truncated PDF behind. The data lands in a sibling `.part` file first.
+
+    With expected_size (the body's Content-Length), the file is
+    preallocated in one extent where the platform supports it.
+    """
+    tmp = tempfile.NamedTemporaryFile(
+        dir=os.path.dirname(os.path.abspath(output_path)),
+        prefix=os.path.basename(output_path) + ".",
+        suffix=".part",
+        buffering=0,
+        delete=False,
+    )
+    try:
+        with tmp:
+            if expected_size and hasattr(os, "posix_fallocate"):
+                try:
+                    os.posix_fallocate(tmp.fileno(), 0, expected_size)
+                except OSError:
+                    pass
+            yield tmp
+            # Drop any preallocated tail if the body came up short
+            tmp.truncate()
+            os.fsync(tmp.fileno())
+        os.replace(tmp.name, output_path)
+    except BaseException:
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+        raise
+
+
 class Downloader:
     """
     A utility class to clone a GitHub repository and download PDFs.
@@ -15,11 +105,19 @@ class Downloader:
     is essential for separating 'tmp' and 'workspace' clones).
     """
     
+    # Shared httpx client (connection pool, HTTP/2 when available), created on first use
+    _client = None
+
     def __init__(self, target_dir: str = "tmp", max_retries: int = 5, retry_delay: float = 1.0):
         self.target_dir = target_dir
         self.max_retries = max_retries
         self.retry_delay = retry_delay
 
+    def _retry_delay(self, attempt: int) -> float:
+        """Exponential backoff from retry_delay, capped at RETRY_MAX_DELAY, with +/-50% jitter."""
+        delay = min(RETRY_MAX_DELAY, self.retry_delay * (2 ** (attempt - 1)))
+        return delay * random.uniform(0.5, 1.5)
+
     def _cleanup_error_handler(self, func, path, exc_info):
         """
         Custom error handler for shutil.rmtree to handle Windows permission errors.
@@ -46,23 +144,40 @@ class Downloader:
         
         for attempt in range(1, self.max_retries + 1):
             try:
-                shutil.rmtree(path, onerror=self._cleanup_error_handler)
+                fast_rmtree(path, onerror=self._cleanup_error_handler)
                 print(f"Directory '{path}' successfully deleted on attempt {attempt}.")
                 return True
             except Exception as e:
                 if attempt < self.max_retries:
-                    print(f"Cleanup attempt {attempt} failed: {type(e).__name__} - {e}. Retrying in {self.retry_delay}s...")
-                    time.sleep(self.retry_delay)
+                    delay = self._retry_delay(attempt)
+                    print(f"Cleanup attempt {attempt} failed: {type(e).__name__} - {e}. Retrying in {delay:.1f}s...")
+                    time.sleep(delay)
                 else:
                     print(f"Error during directory cleanup after {self.max_retries} attempts: {e}")
                     raise 
         return False
 
-    def download(self, github_link: str, target_path: str, branch: Optional[str] = None) -> bool:
+    def download(
+        self,
+        github_link: str,
+        target_path: str,
+        branch: Optional[str] = None,
+        use_cache: bool = True,
+        depth: Optional[int] = 1,
+    ) -> bool:
         """
         Clones the specified GitHub repository into the target_path.
-        
-        CRITICAL FIX: The target_path argument is now used as the destination in the git command.
+
+        The clone is shallow (depth commits, the tip only by default) and
+        blobless; pass depth=None for full history.
+
+        Without use_cache, a GitHub repository is first fetched as a source
+        tarball (files only, no .git), falling back to cloning when that fails
+        or the repository has submodules.
+
+        With use_cache, the clone is kept under CLONE_CACHE_DIR keyed by
+        sha256(url + branch). A cache hit only fetches the current tip and the
+        working tree is hard-linked into target_path instead of re-cloning.
         """
         
         try:
@@ -70,9 +185,159 @@ class Downloader:
         except Exception:
             return False
 
-        print(f"Attempting to clone '{github_link}' into '{target_path}'...")
+        if not use_cache:
+            if depth == 1 and self._download_archive(github_link, target_path, branch):
+                return True
+            print(f"Attempting to clone '{github_link}' into '{target_path}'...")
+            return self._clone(github_link, target_path, branch, depth)
+
+        cache_dir = self._clone_cache_dir(github_link, branch, depth)
+        CLONE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+        # Concurrent runs (batch_eval) on the same repository take turns, so
+        # nobody links from a tree another run is fetching or resetting
+        with cache_entry_lock(cache_dir):
+            if (cache_dir / ".git").is_dir():
+                print(f"[CACHE] Clone cache hit for '{github_link}': {cache_dir}")
+                if self._refresh_cached_clone(cache_dir, branch, depth):
+                    self._record_entry_size(cache_dir)
+            else:
+                print(f"[CACHE] Clone cache miss for '{github_link}'.")
+                print(f"Attempting to clone '{github_link}' into '{cache_dir}'...")
+                if not self._clone_into_cache(github_link, cache_dir, branch, depth):
+                    return False
+                self._record_entry_size(cache_dir)
+
+            # Mark the entry as recently used for LRU eviction
+            os.utime(cache_dir)
+
+            try:
+                self._link_tree(cache_dir, Path(target_path))
+            except OSError as e:
+                print(f"[ERROR] Could not copy cached clone into '{target_path}': {e}")
+                return False
+
+        print(f"Cached clone linked into '{target_path}'.")
+        self._evict_clone_cache(keep=cache_dir)
+        return True
+
+    def _download_archive(self, github_link: str, target_path: str, branch: Optional[str]) -> bool:
+        """
+        Streams a GitHub source tarball into target_path, stripping its
+        top-level '<repo>-<sha>/' directory. Returns False (leaving nothing
+        behind) for non-GitHub links, download or extraction errors, and
+        repositories with submodules, which archives don't include.
+        """
+        match = GITHUB_REPO_RE.match(github_link)
+        if not match:
+            return False
+
+        owner, repo = match.groups()
+        url = GITHUB_ARCHIVE_URL.format(owner=owner, repo=repo, ref=branch or "HEAD")
+        print(f"Attempting to download '{url}' into '{target_path}'...")
 
-        command = ['git', 'clone']
+        # Reject absolute paths, '..' and device files where tarfile supports filters
+        extract_kwargs = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+        request = urllib.request.Request(url, headers={"User-Agent": DOWNLOAD_HEADERS["User-Agent"]})
+        try:
+            with urllib.request.urlopen(request, timeout=DOWNLOAD_TIMEOUT) as response, \
+                    tarfile.open(fileobj=response, mode="r|gz") as archive:
+                for member in archive:
+                    _, sep, name = member.name.partition("/")
+                    if not sep or not name:
+                        continue
+                    member.name = name
+                    if member.islnk():
+                        member.linkname = member.linkname.partition("/")[2]
+                    archive.extract(member, target_path, **extract_kwargs)
+        except (OSError, tarfile.TarError) as e:
+            print(f"[WARNING] Archive download failed, falling back to git clone: {e}")
+            shutil.rmtree(target_path, ignore_errors=True)
+            return False
+
+        if os.path.exists(os.path.join(target_path, ".gitmodules")):
+            print("[INFO] Repository has submodules, which archives don't include; cloning instead.")
+            shutil.rmtree(target_path, ignore_errors=True)
+            return False
+
+        print("Archive download successful.")
+        return True
+
+    def _clone(
+        self,
+        github_link: str,
+        target_path: str,
+        branch: Optional[str] = None,
+        depth: Optional[int] = 1,
+    ) -> bool:
+        """Clones into target_path in-process with pygit2 when installed, else via `git clone`."""
+        if pygit2 is not None:
+            result = self._clone_pygit2(github_link, target_path, branch, depth)
+            if result is not None:
+                return result
+        return self._clone_subprocess(github_link, target_path, branch, depth)
+
+    def _clone_pygit2(
+        self,
+        github_link: str,
+        target_path: str,
+        branch: Optional[str],
+        depth: Optional[int] = 1,
+    ) -> Optional[bool]:
+        """
+        Shallow-clones with libgit2 (depth=0 there means full history),
+        aborting after CLONE_TIMEOUT seconds.
+        Returns None if this pygit2 build can't do shallow clones or libgit2
+        fails, so the caller falls back to the git CLI; False on timeout.
+        The partial target_path is removed on every failure.
+        """
+        deadline = time.monotonic() + CLONE_TIMEOUT
+
+        class TimeoutCallbacks(pygit2.RemoteCallbacks):
+            def transfer_progress(self, stats):
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"clone exceeded {CLONE_TIMEOUT} seconds")
+
+        try:
+            repo = pygit2.clone_repository(
+                github_link, target_path,
+                checkout_branch=branch, depth=depth or 0, callbacks=TimeoutCallbacks()
+            )
+            if os.path.exists(os.path.join(target_path, ".gitmodules")):
+                repo.submodules.update(init=True, depth=depth or 0)
+        except TypeError:
+            # pygit2 < 1.14 has no depth argument
+            shutil.rmtree(target_path, ignore_errors=True)
+            return None
+        except TimeoutError as e:
+            print(f"[ERROR] Git clone failed (libgit2): {e}")
+            shutil.rmtree(target_path, ignore_errors=True)
+            return False
+        except (pygit2.GitError, ValueError) as e:
+            # libgit2 has failure modes git doesn't share (proxy/SSH config,
+            # some servers' shallow fetch): let the git CLI try
+            print(f"[WARNING] Git clone failed (libgit2), retrying with git: {e}")
+            shutil.rmtree(target_path, ignore_errors=True)
+            return None
+
+        print("Cloning successful.")
+        return True
+
+    def _clone_subprocess(
+        self,
+        github_link: str,
+        target_path: str,
+        branch: Optional[str] = None,
+        depth: Optional[int] = 1,
+    ) -> bool:
+        """Runs `git clone` into target_path and reports failures."""
+        command = [
+            GIT, '-c', 'protocol.version=2', 'clone',
+            '--filter=blob:none', '--single-branch', '--no-tags',
+            '--recurse-submodules', f'--jobs={GIT_JOBS}',
+        ]
+        if depth:
+            command.extend([f'--depth={depth}', '--shallow-submodules'])
         
         if branch:
             command.extend(['--branch', branch])
@@ -80,27 +345,206 @@ class Downloader:
         command.extend([github_link, target_path])
 
         try:
-            result = subprocess.run(
-                command,
-                check=True,
-                capture_output=True,
-                text=True
-            )
+            self._run_git(command)
             print("Cloning successful.")
-            print(f"Output:\n{result.stdout}")
             return True
             
         except subprocess.CalledProcessError as e:
             print(f"\n--- ERROR DURING GIT CLONE ---")
-            print(f"Command failed with exit code {e.returncode}: {' '.join(command)}")
-            print(f"STDERR:\n{e.stderr}")
+            print(f"[ERROR] Git clone failed with exit code {e.returncode}: {' '.join(command)}")
             print(f"------------------------------")
             return False
+        except subprocess.TimeoutExpired:
+            print(f"[ERROR] Git clone timed out after {CLONE_TIMEOUT} seconds.")
+            return False
         except FileNotFoundError:
             print("\n--- ERROR: GIT NOT FOUND ---")
             print("The 'git' command was not found. Please ensure Git is installed and added to your system's PATH.")
             print("------------------------------")
             return False
+
+    def _run_git(self, command: List[str]) -> None:
+        """
+        Runs a git command, streaming its stderr (progress, errors) through live
+        instead of buffering it. The stream is passed through as raw bytes, so
+        nothing is decoded on the success path; only the tail kept for the
+        CalledProcessError raised on a non-zero exit (the last
+        GIT_STDERR_TAIL_LINES lines) is decoded. Raises subprocess.TimeoutExpired
+        after CLONE_TIMEOUT seconds.
+        """
+        proc = subprocess.Popen(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            env=self._git_env(),
+            close_fds=CLOSE_FDS,
+        )
+        tail: Deque[bytes] = deque(maxlen=GIT_STDERR_TAIL_LINES)
+        sys.stderr.flush()
+        out = getattr(sys.stderr, "buffer", None)
+
+        def pump() -> None:
+            # read1 returns whatever is available, so \r-terminated progress
+            # updates are forwarded as they arrive rather than per full line.
+            for chunk in iter(lambda: proc.stderr.read1(65536), b""):
+                if out is not None:
+                    out.write(chunk)
+                    out.flush()
+                tail.append(chunk)
+
+        reader = threading.Thread(target=pump, daemon=True)
+        reader.start()
+        try:
+            returncode = proc.wait(timeout=CLONE_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            reader.join(timeout=5)
+
+        if returncode != 0:
+            lines = b"".join(tail).decode("utf-8", errors="replace").splitlines(keepends=True)
+            raise subprocess.CalledProcessError(
+                returncode, command, stderr="".join(lines[-GIT_STDERR_TAIL_LINES:])
+            )
+
+    @staticmethod
+    def _git_env() -> dict:
+        """Environment for git commands: fail fast instead of prompting for credentials."""
+        return {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+
+    def _clone_cache_dir(self, github_link: str, branch: Optional[str], depth: Optional[int] = 1) -> Path:
+        """Returns the cache directory for a repository URL + branch (+ depth, unless the default)."""
+        ident = github_link + (branch or "")
+        if depth != 1:
+            ident += f"#depth={depth or 0}"
+        key = hashlib.sha256(ident.encode()).hexdigest()
+        return CLONE_CACHE_DIR / key
+
+    def _clone_into_cache(
+        self,
+        github_link: str,
+        cache_dir: Path,
+        branch: Optional[str],
+        depth: Optional[int] = 1,
+    ) -> bool:
+        """
+        Clones into a private staging directory and renames it into place, so
+        concurrent runs never observe a half-written cache entry.
+        """
+        cache_dir.parent.mkdir(parents=True, exist_ok=True)
+        staging = cache_dir.with_name(f"{cache_dir.name}.partial.{os.getpid()}")
+        shutil.rmtree(staging, ignore_errors=True)
+
+        if not self._clone(github_link, str(staging), branch, depth):
+            shutil.rmtree(staging, ignore_errors=True)
+            return False
+
+        try:
+            os.rename(staging, cache_dir)
+        except OSError:
+            # Another run populated the same entry first; keep theirs.
+            shutil.rmtree(staging, ignore_errors=True)
+        return True
+
+    def _refresh_cached_clone(self, cache_dir: Path, branch: Optional[str], depth: Optional[int] = 1) -> bool:
+        """
+        Fetches the current tip into a cached clone and resets its working tree
+        to it. Returns False (keeping the cached copy as is) if that fails.
+        """
+        ref = branch or "HEAD"
+        depth_args = [f'--depth={depth}'] if depth else []
+        commands: List[List[str]] = [
+            [GIT, '-C', str(cache_dir), '-c', 'protocol.version=2', 'fetch', *depth_args, '--no-tags', 'origin', ref],
+            [GIT, '-C', str(cache_dir), 'reset', '--hard', 'FETCH_HEAD'],
+            [GIT, '-C', str(cache_dir), 'submodule', 'update', '--init', '--recursive', *depth_args, f'--jobs={GIT_JOBS}'],
+        ]
+        try:
+            for command in commands:
+                self._run_git(command)
+            print("Cached clone refreshed.")
+            return True
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            stderr = getattr(e, "stderr", "") or ""
+            print(f"[WARNING] Could not refresh cached clone, using cached copy: {stderr.strip() or e}")
+            return False
+
+    def _link_tree(self, source: Path, target: Path) -> None:
+        """
+        Copies a directory tree using hard links, falling back to a real copy
+        when linking is not possible (e.g. the cache is on another filesystem).
+        """
+        def link_or_copy(src: str, dst: str) -> None:
+            try:
+                os.link(src, dst)
+            except OSError:
+                shutil.copy2(src, dst)
+
+        shutil.copytree(source, target, symlinks=True, copy_function=link_or_copy)
+
+    @staticmethod
+    def _entry_size_file(cache_dir: Path) -> Path:
+        """Sidecar recording a cache entry's size, so eviction needn't walk the tree."""
+        return cache_dir.with_name(f"{cache_dir.name}.size")
+
+    def _record_entry_size(self, cache_dir: Path) -> int:
+        """Measures a cache entry once (after a clone or refresh) and records the result."""
+        size = self._tree_size(str(cache_dir))
+        try:
+            self._entry_size_file(cache_dir).write_text(str(size), encoding="utf-8")
+        except OSError:
+            pass
+        return size
+
+    def _entry_size(self, cache_dir: Path) -> int:
+        """Returns a cache entry's recorded size, measuring entries cached before sizes were recorded."""
+        try:
+            return int(self._entry_size_file(cache_dir).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return self._record_entry_size(cache_dir)
+
+    def _evict_clone_cache(self, keep: Path) -> None:
+        """
+        Removes least-recently-used cached clones until the cache fits
+        CLONE_CACHE_MAX_BYTES. Recency is the entry's mtime (set by download);
+        atime is unreliable, since measuring or reading a tree bumps it.
+        Entries locked by another run are skipped.
+        """
+        entries = []
+        total_size = 0
+        for entry in os.scandir(CLONE_CACHE_DIR):
+            if not entry.is_dir(follow_symlinks=False) or ".partial." in entry.name:
+                continue
+            path = Path(entry.path)
+            size = self._entry_size(path)
+            entries.append((entry.stat().st_mtime, path, size))
+            total_size += size
+
+        for _, path, size in sorted(entries, key=lambda e: e[0]):
+            if total_size <= CLONE_CACHE_MAX_BYTES:
+                break
+            if path == keep:
+                continue
+            with cache_entry_lock(path, blocking=False) as locked:
+                if not locked:
+                    continue
+                print(f"[CACHE] Evicting cached clone: {path}")
+                shutil.rmtree(path, ignore_errors=True)
+                self._entry_size_file(path).unlink(missing_ok=True)
+            total_size -= size
+
+    @staticmethod
+    def _tree_size(root: str) -> int:
+        """Returns the total size in bytes of the files under root."""
+        total = 0
+        for dirpath, _, filenames in os.walk(root):
+            for name in filenames:
+                try:
+                    total += os.lstat(os.path.join(dirpath, name)).st_size
+                except OSError:
+                    pass
+        return total
         
     def download_pdf(self, pdf_url: str, output_path: Optional[str] = None) -> bool:
         """
@@ -122,27 +566,168 @@ class Downloader:
 
         print(f"Attempting to download PDF from '{pdf_url}' to '{output_path}'...")
 
+        def write(chunks: Iterable[bytes], expected_size: Optional[int]) -> bool:
+            self._write_chunks(chunks, output_path, expected_size)
+            return True
+
+        return self._fetch_with_retries(pdf_url, write) is not None
+
+    def fetch_pdf(self, pdf_url: str) -> Optional[bytes]:
+        """
+        Download a PDF into memory, with the same retries as download_pdf.
+
+        Returns the body, or None if every attempt failed.
+        """
+        print(f"Attempting to download PDF from '{pdf_url}'...")
+        return self._fetch_with_retries(pdf_url, lambda chunks, _size: b"".join(chunks))
+
+    def _fetch_with_retries(self, pdf_url: str, consume: Callable[[Iterable[bytes], Optional[int]], T]) -> Optional[T]:
+        """
+        Streams pdf_url's body into consume(chunks, expected_size), retrying
+        with backoff. Returns consume's result, or None after max_retries
+        failed attempts.
+        """
         for attempt in range(1, self.max_retries + 1):
             try:
-                with urllib.request.urlopen(pdf_url) as response:
-                    if response.status != 200:
-                        raise OSError(f"HTTP status {response.status}")
-
-                    with open(output_path, "wb") as f:
-                        shutil.copyfileobj(response, f)
+                if httpx is not None:
+                    result = self._fetch_httpx(pdf_url, consume)
+                else:
+                    result = self._fetch_urllib(pdf_url, consume)
 
                 print(f"PDF successfully downloaded on attempt {attempt}.")
-                return True
+                return result
 
             except Exception as e:
                 if attempt < self.max_retries:
+                    delay = self._retry_delay(attempt)
                     print(
                         f"Download attempt {attempt} failed: "
-                        f"{type(e).__name__} - {e}. Retrying in {self.retry_delay}s..."
+                        f"{type(e).__name__} - {e}. Retrying in {delay:.1f}s..."
                     )
-                    time.sleep(self.retry_delay)
+                    time.sleep(delay)
                 else:
                     print(
                         f"Error downloading PDF after {self.max_retries} attempts: {e}"
                     )
-                return False
\ No newline at end of file
+        return None
+
+    @classmethod
+    def _http_client(cls):
+        """Returns the process-wide httpx.Client, so retries and later downloads reuse connections."""
+        if cls._client is None:
+            cls._client = httpx.Client(
+                http2=HTTP2_AVAILABLE,
+                timeout=DOWNLOAD_TIMEOUT,
+                follow_redirects=True,
+                limits=httpx.Limits(max_keepalive_connections=32),
+            )
+        return cls._client
+
+    def _fetch_httpx(self, pdf_url: str, consume: Callable[[Iterable[bytes], Optional[int]], T]) -> T:
+        """Streams pdf_url's body into consume through the shared httpx client."""
+        with self._http_client().stream("GET", pdf_url) as response:
+            response.raise_for_status()
+            return consume(
+                response.iter_bytes(DOWNLOAD_CHUNK_SIZE),
+                self._identity_length(response.headers)
+            )
+
+    def _fetch_urllib(self, pdf_url: str, consume: Callable[[Iterable[bytes], Optional[int]], T]) -> T:
+        """Streams pdf_url's body into consume with urllib (used when httpx is not installed)."""
+        request = urllib.request.Request(pdf_url, headers=DOWNLOAD_HEADERS)
+        with urllib.request.urlopen(request, timeout=DOWNLOAD_TIMEOUT) as response:
+            if response.status != 200:
+                raise OSError(f"HTTP status {response.status}")
+            body = response
+            if response.headers.get("Content-Encoding", "").lower() == "gzip":
+                body = gzip.GzipFile(fileobj=response)
+            return consume(
+                iter(lambda: body.read(DOWNLOAD_CHUNK_SIZE), b""),
+                self._identity_length(response.headers)
+            )
+
+    @staticmethod
+    def _identity_length(headers) -> Optional[int]:
+        """Returns Content-Length when it is the size of the decoded body, else None."""
+        if headers.get("Content-Encoding", "identity").lower() != "identity":
+            return None
+        try:
+            return int(headers.get("Content-Length", ""))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _write_chunks(chunks: Iterable[bytes], output_path: str, expected_size: Optional[int] = None) -> None:
+        """
+        Writes a response body to output_path chunk by chunk.
+
+        Deliberately plain write() calls: for one file, setting up batched
+        I/O (thread pools, io_uring) costs more than it saves; only the
+        multi-file paths (download_many, utils.parallel_rmtree) batch work.
+        """
+        with atomic_output(output_path, expected_size) as f:
+            for chunk in chunks:
+                f.write(chunk)
+
+    async def download_pdf_async(self, pdf_url: str, output_path: str, client=None) -> bool:
+        """
+        Async variant of download_pdf. Streams through a shared
+        httpx.AsyncClient when one is given, otherwise runs download_pdf in a
+        worker thread.
+        """
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        if client is None:
+            return await asyncio.to_thread(self.download_pdf, pdf_url, output_path)
+
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                async with client.stream("GET", pdf_url) as response:
+                    response.raise_for_status()
+                    with atomic_output(output_path) as f:
+                        async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                print(f"PDF '{pdf_url}' downloaded on attempt {attempt}.")
+                return True
+            except Exception as e:
+                if attempt < self.max_retries:
+                    delay = self._retry_delay(attempt)
+                    print(f"Download attempt {attempt} for '{pdf_url}' failed: {type(e).__name__} - {e}. Retrying in {delay:.1f}s...")
+                    await asyncio.sleep(delay)
+                else:
+                    print(f"Error downloading PDF '{pdf_url}' after {self.max_retries} attempts: {e}")
+        return False
+
+    async def download_many(self, downloads: Dict[str, str], limit: int = 32) -> Dict[str, bool]:
+        """
+        Downloads several PDFs concurrently.
+
+        `downloads` maps each PDF URL to its output path; returns URL -> success.
+        """
+        results: Dict[str, bool] = {}
+        sem = asyncio.Semaphore(limit)
+
+        async def fetch(url: str, path: str, client) -> None:
+            async with sem:
+                results[url] = await self.download_pdf_async(url, path, client)
+
+        async def fetch_all(client) -> None:
+            async with asyncio.TaskGroup() as tg:
+                for url, path in downloads.items():
+                    tg.create_task(fetch(url, path, client))
+
+        if httpx is not None:
+            # One client: same-host PDFs share connections (multiplexed over HTTP/2 when available)
+            async with httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                timeout=DOWNLOAD_TIMEOUT,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=limit),
+            ) as client:
+                await fetch_all(client)
+        else:
+            await fetch_all(None)
+        return results
+
+    def download_pdfs(self, downloads: Dict[str, str]) -> Dict[str, bool]:
+        """Blocking wrapper around download_many."""
+        return asyncio.run(self.download_many(downloads))
@@ -15,16 +15,16 @@ import sys
 import argparse
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Set
+from typing import List, Optional, Set
 
-from downloader import Downloader
-from paper_extracter import PaperParser
-from requirements_extract import RequirementsExtractor
-from venv_create import setup_venv_and_install, get_venv_python
-from demo_creator import DemoCreator
+from downloader import Downloader, atomic_output
+from paper_cache import PaperCache
 
-from utils import get_installed_packages, clone_repository, run_demo
+# PaperParser, RequirementsExtractor, setup_venv_and_install and DemoCreator
+# pull in PDF and LLM libraries; they are imported inside the step that
+# needs them so --help and early failures stay fast.
 
 from constants import (
     TMP_DIR, 
@@ -32,7 +32,7 @@ from constants import (
     DEMO_FILENAME
 )
 
-def main():
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Repoduce-Me: Scientific Code Reproducibility Pipeline",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -57,6 +57,11 @@ def main():
         action="store_true",
         help="Use ephemeral tmp/ directory instead of workspace/"
     )
+    parser.add_argument(
+        "--work-dir",
+        default=None,
+        help="Explicit working directory (overrides --tmp; used by batch_eval.py)"
+    )
     parser.add_argument(
         "--auto-run",
         action="store_true",
@@ -72,42 +77,78 @@ def main():
         default=None,
         help="Python executable to use for creating the virtual environment"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't reuse the persistent paper/clone/venv caches in ~/.repro_cache"
+    )
     parser.add_argument(
         "--no-cleanup",
         action="store_true",
         help="Don't clean up temporary files on failure"
     )
+    return parser
+
+
+def extract_dependencies(repo_dir: Path, output_dir: Path) -> List[str]:
+    """Run RequirementsExtractor on a cloned repo (STEP 4)."""
+    from requirements_extract import RequirementsExtractor
+
+    extractor = RequirementsExtractor(repo_dir=repo_dir, output_dir=output_dir)
+    return extractor.extract()
+
+
+def run(args: argparse.Namespace) -> int:
+    """
+    Run the whole pipeline for already-parsed arguments and return the exit code.
+
+    Kept separate from main() so batch_eval.py can call it in a pre-imported
+    worker process instead of starting a new interpreter per paper.
+    """
+    if args.work_dir:
+        work_dir = args.work_dir
+    else:
+        work_dir = TMP_DIR if args.tmp else WORKSPACE_DIR
     
-    args = parser.parse_args()
-    
-    work_dir = TMP_DIR if args.tmp else WORKSPACE_DIR
-    
-    os.makedirs(work_dir, exist_ok=True)
-    
-    work_dir_abs = os.path.abspath(work_dir)
-    repo_dir = os.path.join(work_dir_abs, "repo")
-    venv_dir = os.path.join(work_dir_abs, ".venv_repro")
+    # Resolved once; converted to str only where a callee expects one
+    work_dir_abs = Path(work_dir).resolve()
+    work_dir_abs.mkdir(parents=True, exist_ok=True)
+    repo_dir = work_dir_abs / "repo"
+    venv_dir = work_dir_abs / ".venv_repro"
     
-    demo_path = os.path.join(repo_dir, DEMO_FILENAME)
+    demo_path = repo_dir / DEMO_FILENAME
     
     print(f"\n--- Starting Pipeline Execution with Input: {args.input} ---")
     
+    # Downloaded PDFs and parsed GitHub URLs are cached for URL inputs only
+    is_url = args.input.startswith(('http://', 'https://'))
+    paper_cache = PaperCache() if is_url and not args.no_cache else None
+    
     try:
         # ============================================================
         # STEP 1: Resolve input to local PDF
         # ============================================================
         input_path = args.input
+        pdf_bytes: Optional[bytes] = None
         
-        if input_path.startswith(('http://', 'https://')):
+        if is_url:
             print("--- STEP 1: Input is a URL. Downloading PDF... ---")
             
-            downloader = Downloader(target_dir=work_dir_abs)
-            pdf_path = os.path.join(work_dir_abs, "downloaded_paper.pdf")
+            pdf_path = str(work_dir_abs / "downloaded_paper.pdf")
             
-            success = downloader.download_pdf(input_path, pdf_path)
-            if not success:
-                raise RuntimeError(f"Failed to download PDF from {input_path}")
-            print(f"PDF successfully downloaded on attempt 1.\n")
+            if paper_cache is not None and paper_cache.get_pdf(input_path, pdf_path):
+                print(f"[CACHE] Using cached PDF for {input_path}\n")
+            else:
+                downloader = Downloader(target_dir=str(work_dir_abs))
+                pdf_bytes = downloader.fetch_pdf(input_path)
+                if pdf_bytes is None:
+                    raise RuntimeError(f"Failed to download PDF from {input_path}")
+                # STEP 2 parses pdf_bytes directly; the file is the workspace copy
+                with atomic_output(pdf_path, len(pdf_bytes)) as f:
+                    f.write(pdf_bytes)
+                print(f"PDF saved to {pdf_path}\n")
+                if paper_cache is not None:
+                    paper_cache.put_pdf(input_path, pdf_path)
         else:
             print("--- STEP 1: Input is a local file. ---")
             if not os.path.exists(input_path):
@@ -120,12 +161,19 @@ def main():
         # ============================================================
         print("--- STEP 2: Parsing PDF for GitHub Repository URL... ---")
         
+        cached_github_url = paper_cache.get_github_url(input_path) if paper_cache is not None else None
+        
         if args.github:
             github_url = args.github
             print(f"[INFO] Using provided GitHub URL: {github_url}")
+        elif cached_github_url:
+            github_url = cached_github_url
+            print("[CACHE] Using GitHub URL previously parsed from this paper.")
         else:
-            # Create parser with the PDF path
-            paper_parser = PaperParser(pdf_path)
+            from paper_extracter import PaperParser
+
+            # Parse the freshly downloaded bytes in memory, else the PDF file
+            paper_parser = PaperParser(pdf_bytes if pdf_bytes is not None else pdf_path)
             github_links = paper_parser.extract_github_link()
             
             if not github_links:
@@ -133,6 +181,8 @@ def main():
             
             # Use the first found link
             github_url = github_links[0]
+            if paper_cache is not None:
+                paper_cache.put_github_url(input_path, github_url)
         
         print(f"[SUCCESS] Found GitHub URL: {github_url}\n")
         
@@ -141,48 +191,69 @@ def main():
         # ============================================================
         print("--- STEP 3: Cloning GitHub Repository... ---")
         
-        if not clone_repository(github_url, repo_dir):
+        downloader = Downloader(target_dir=str(work_dir_abs))
+        if not downloader.download(github_url, str(repo_dir), use_cache=not args.no_cache):
             raise RuntimeError(f"Failed to clone repository: {github_url}")
         
         print(f"[SUCCESS] Repository successfully cloned into: {repo_dir}\n")
         
         # ============================================================
-        # STEP 4: Analyze dependencies (informational)
+        # STEP 4: Analyze dependencies
         # ============================================================
-        print("--- STEP 4: Dependency Extraction using RequirementsExtractor... ---")
-        
-        try:
-            extractor = RequirementsExtractor(repo_dir=repo_dir, output_dir=work_dir_abs)
-            deps = extractor.extract()
-            
-            if deps:
-                if deps[0] == "__USE_PYPROJECT__":
+        # Extraction only reads the clone, so it runs in the background
+        # while STEP 5 builds the venv; STEP 5 only waits for it when the
+        # repo has no dependency file of its own. Its report is printed
+        # once both are done so the two steps' output doesn't interleave.
+        print("--- STEP 4: Dependency Extraction using RequirementsExtractor... ---\n")
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            deps_future = executor.submit(extract_dependencies, repo_dir, work_dir_abs)
+
+            # ============================================================
+            # STEP 5: Create virtual environment and install dependencies
+            # ============================================================
+            print(f"--- STEP 5: Setting up Virtual Environment in {venv_dir}... ---")
+
+            from venv_create import setup_venv_and_install
+
+            def extracted_requirements() -> Optional[str]:
+                # Repos without a dependency file install what STEP 4's
+                # import analysis found; this waits for it to finish.
+                try:
+                    deps = deps_future.result()
+                except Exception:
+                    return None
+                requirements_file = work_dir_abs / "requirements.txt"
+                if deps and not deps[0].startswith("__USE_") and requirements_file.is_file():
+                    return str(requirements_file)
+                return None
+
+            success, venv_python = setup_venv_and_install(
+                venv_path=str(venv_dir),
+                repo_path=str(repo_dir),
+                python_executable=args.python,
+                preinstall_deps=["numpy", "scipy"],
+                use_cache=not args.no_cache,
+                extracted_requirements=extracted_requirements
+            )
+
+            print("\n[INFO] STEP 4 dependency analysis:")
+            try:
+                deps = deps_future.result()
+
+                if deps:
+                    if deps[0] == "__USE_PYPROJECT__":
+                        print("[INFO] pyproject.toml detected - installation will be handled via pip install .")
+                    elif deps[0] == "__USE_SETUPTOOLS__":
+                        print("[INFO] setup.py/setup.cfg detected - installation will be handled via pip install .")
+                    else:
+                        print(f"[INFO] Found {len(deps)} dependencies.")
+            except Exception as e:
+                print(f"[WARNING] Dependency analysis failed: {e}")
+                # Check for pyproject.toml manually
+                if (repo_dir / "pyproject.toml").exists():
                     print("[INFO] pyproject.toml detected - installation will be handled via pip install .")
-                elif deps[0] == "__USE_SETUPTOOLS__":
-                    print("[INFO] setup.py/setup.cfg detected - installation will be handled via pip install .")
-                else:
-                    print(f"[INFO] Found {len(deps)} dependencies.")
-        except Exception as e:
-            print(f"[WARNING] Dependency analysis failed: {e}")
-            # Check for pyproject.toml manually
-            pyproject_path = os.path.join(repo_dir, "pyproject.toml")
-            if os.path.exists(pyproject_path):
-                print("[INFO] pyproject.toml detected - installation will be handled via pip install .")
-        
-        print()
-        
-        # ============================================================
-        # STEP 5: Create virtual environment and install dependencies
-        # ============================================================
-        print(f"--- STEP 5: Setting up Virtual Environment in {venv_dir}... ---")
-        
-        success, venv_python = setup_venv_and_install(
-            venv_path=venv_dir,
-            repo_path=repo_dir,
-            python_executable=args.python,
-            preinstall_deps=["numpy", "scipy"]
-        )
-        
+
         if not success:
             raise RuntimeError("Failed to setup virtual environment and install dependencies")
         
@@ -197,12 +268,16 @@ def main():
             print("--- STEP 6: Generating Demo Script... ---")
             
             try:
+                from demo_creator import DemoCreator
+                from utils import get_installed_packages
+
                 installed_packages = get_installed_packages(venv_python)
                 
                 creator = DemoCreator(
                     repo_path=repo_dir,
                     output_filename=DEMO_FILENAME,
-                    installed_packages=installed_packages
+                    installed_packages=installed_packages,
+                    use_cache=not args.no_cache
                 )
                 
                 # Generate the demo
@@ -210,7 +285,7 @@ def main():
                 
                 if result_path and Path(result_path).exists():
                     demo_generated = True
-                    demo_path = str(result_path)
+                    demo_path = Path(result_path)
                     print(f"[SUCCESS] Demo script generated at: {demo_path}\n")
                 else:
                     print("[WARNING] Demo generation failed or was skipped.\n")
@@ -225,9 +300,13 @@ def main():
         # ============================================================
         # STEP 7: Auto-run demo if requested
         # ============================================================
-        if args.auto_run and demo_generated and os.path.exists(demo_path):
+        if args.auto_run and demo_generated and demo_path.exists():
             print("--- STEP 7: Auto-Running Generated Demo... ---")
-            run_demo(venv_python, demo_path, repo_dir)
+            from utils import run_demo
+
+            if not run_demo(venv_python, str(demo_path), str(repo_dir)):
+                # Don't hand the same broken demo to the next run
+                creator.discard_cached_demo()
         elif args.auto_run:
             print("--- STEP 7: Skipping Auto-Run (no demo available) ---\n")
         
@@ -268,5 +347,10 @@ def main():
         return 1
 
 
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return run(args)
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,74 @@
+"""
+paper_cache.py — Persistent cache of downloaded paper PDFs and the GitHub
+URL parsed out of them, so re-running the pipeline on the same paper URL
+skips STEP 1's download and STEP 2's PDF parse.
+
+Entries live under PAPER_CACHE_DIR, keyed by blake2b(url):
+    <key>.pdf   the downloaded PDF
+    <key>.json  {"url": ..., "github_url": ...}
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Optional
+
+from constants import PAPER_CACHE_DIR
+
+
+class PaperCache:
+    """Content cache for paper PDFs and their resolved GitHub URLs."""
+
+    def __init__(self, cache_dir: Path = PAPER_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+
+    def _key(self, url: str) -> str:
+        return hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _atomic_write(self, target: Path, write) -> None:
+        """Writes through a unique temp file and os.replace, so readers never see a partial entry."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f"{target.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            write(tmp)
+            os.replace(tmp, target)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+
+    def get_pdf(self, url: str, output_path: str) -> bool:
+        """Places the cached PDF for url at output_path; returns False on a miss."""
+        cached = self.cache_dir / f"{self._key(url)}.pdf"
+        if not cached.is_file():
+            return False
+
+        if os.path.lexists(output_path):
+            os.remove(output_path)
+        try:
+            os.link(cached, output_path)
+        except OSError:
+            shutil.copy2(cached, output_path)
+        return True
+
+    def put_pdf(self, url: str, pdf_path: str) -> None:
+        """Stores a downloaded PDF for url."""
+        target = self.cache_dir / f"{self._key(url)}.pdf"
+        self._atomic_write(target, lambda tmp: shutil.copy2(pdf_path, tmp))
+
+    def get_github_url(self, url: str) -> Optional[str]:
+        """Returns the GitHub URL previously parsed from the paper at url, if any."""
+        meta_path = self.cache_dir / f"{self._key(url)}.json"
+        try:
+            with meta_path.open("r", encoding="utf-8") as f:
+                return json.load(f).get("github_url") or None
+        except (OSError, ValueError):
+            return None
+
+    def put_github_url(self, url: str, github_url: str) -> None:
+        """Records the GitHub URL parsed from the paper at url."""
+        target = self.cache_dir / f"{self._key(url)}.json"
+        payload = json.dumps({"url": url, "github_url": github_url})
+        self._atomic_write(target, lambda tmp: tmp.write_text(payload, encoding="utf-8"))
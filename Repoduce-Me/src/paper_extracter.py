@@ -1,29 +1,63 @@
+import io
 import re
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Optional, Tuple, Union
 import json
 
 from PyPDF2 import PdfReader
 from constructor_model import ConstructorModel
 
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+
+# Compiled once at import. The URL pattern keeps Unicode \s so non-ASCII
+# whitespace (e.g. NBSP from PDF text) still ends a match.
+GITHUB_URL_RE = re.compile(r"https?://github\.com/[^\s)\"'>]+")
+GITHUB_SUBPATH_RE = re.compile(r'/(tree|blob|issues|pull|wiki|releases|commit)/.*$', re.ASCII)
+
 
 class PaperParser:
     """A parser to extract GitHub links from the pdf provided"""
 
-    def __init__(self, paper_filepath: str = ""):
+    def __init__(self, paper_filepath: Union[str, bytes] = ""):
+        # A path to the PDF, or the PDF's bytes when it is already in memory
         self.paper_filepath = paper_filepath
-        self.llm = ConstructorModel(model="gpt-5.1")
+        self._llm: Optional[ConstructorModel] = None
 
+    @property
+    def llm(self) -> ConstructorModel:
+        """Lazy initialization of the LLM (only needed when the PDF has no GitHub link)."""
+        if self._llm is None:
+            self._llm = ConstructorModel(model="gpt-5.1")
+        return self._llm
 
-    def _extract_paper_title(self, reader: PdfReader) -> str:
-        """Return the first non-empty line of the first page."""
-        if not reader.pages:
-            return ""
 
-        first_page = reader.pages[0]
-        text = first_page.extract_text() or ""
+    def _page_texts(self, pdf: Union[Path, bytes]) -> Iterator[str]:
+        """
+        Yield the plain text of each page of a PDF file or in-memory PDF.
+        Uses PyMuPDF when installed (much faster than PyPDF2; only the text
+        is needed, not the layout) and PyPDF2 otherwise.
+        """
+        if fitz is not None:
+            if isinstance(pdf, bytes):
+                doc = fitz.open(stream=pdf, filetype="pdf")
+            else:
+                doc = fitz.open(pdf)
+            with doc:
+                for page in doc:
+                    yield page.get_text("text")
+            return
+
+        reader = PdfReader(io.BytesIO(pdf) if isinstance(pdf, bytes) else pdf)
+        for page in reader.pages:
+            yield page.extract_text() or ""
 
-        for line in text.splitlines():
+    def _extract_paper_title(self, first_page_text: str) -> str:
+        """Return the first non-empty line of the first page."""
+        for line in first_page_text.splitlines():
             line = line.strip()
             if line:
                 return line
@@ -46,55 +80,77 @@ class PaperParser:
         response = self.llm.invoke(prompt)
         return getattr(response, "content", str(response))
 
-    def extract_github_link(self, paper_filepath: str = "") -> List[str]:
+    def _repair_lines(self, lines: List[str], final: bool = False) -> Tuple[List[str], List[str]]:
+        """
+        Repair URLs broken across lines by joining a line ending in '/' or
+        '-' with the next one. Returns (repaired lines, leftover): unless
+        final, a trailing line that still needs its continuation is returned
+        as leftover instead of being emitted.
         """
-        Return a list of GitHub links. If no links are found the list is empty.
+        repaired_lines = []
+        i = 0
+        while i < len(lines):
+            current_line = lines[i].strip()
+            
+            if current_line.endswith('/') or current_line.endswith('-'):
+                if i + 1 < len(lines):
+                    next_line = lines[i+1].strip()
+                    repaired_lines.append(current_line + next_line)
+                    i += 2
+                    continue
+                if not final:
+                    return repaired_lines, [lines[i]]
+            
+            repaired_lines.append(current_line)
+            i += 1
+
+        return repaired_lines, []
+
+    def _links_in(self, repaired_lines: List[str]) -> List[str]:
+        """Return the sanitized GitHub repository URLs found in the lines, in order."""
+        links: List[str] = []
+        for m in GITHUB_URL_RE.findall(" ".join(repaired_lines)):
+            clean = m.rstrip('.,);:\'"')
+            # Sanitize: remove /tree/, /blob/, /issues/, etc. to get root repo
+            clean = GITHUB_SUBPATH_RE.sub('', clean)
+            links.append(clean)
+        return links
+
+    def extract_github_link(self, paper_filepath: Union[str, bytes] = "") -> List[str]:
+        """
+        Return a list of GitHub links: those on the first page that has
+        any. If no links are found the list is empty.
         
         IMPORTANT: Always returns a List[str], never a single string.
         """
         if paper_filepath:
             self.paper_filepath = paper_filepath
 
-        pdf_path = Path(self.paper_filepath)
+        if isinstance(self.paper_filepath, bytes):
+            pdf_path = self.paper_filepath
+        else:
+            pdf_path = Path(self.paper_filepath)
 
-        if not pdf_path.exists():
-            raise FileNotFoundError(f"File not found: {pdf_path}")
-
-        reader = PdfReader(pdf_path)
+            if not pdf_path.exists():
+                raise FileNotFoundError(f"File not found: {pdf_path}")
 
         github_links: List[str] = []
         
-        # Combine all lines from all pages
-        all_lines = []
-        for page in reader.pages:
-            all_lines.extend((page.extract_text() or "").splitlines())
-
-        # Repair broken URLs across lines
-        repaired_lines = []
-        i = 0
-        while i < len(all_lines):
-            current_line = all_lines[i].strip()
-            
-            if (current_line.endswith('/') or current_line.endswith('-')) and i + 1 < len(all_lines):
-                next_line = all_lines[i+1].strip()
-                joined_line = current_line + next_line
-                repaired_lines.append(joined_line)
-                i += 2  
-            else:
-                repaired_lines.append(current_line)
-                i += 1
-
-        continuous_text = " ".join(repaired_lines)
-        
-        # Extract GitHub URLs
-        pattern = re.compile(r"https?://github\.com/[^\s)\"'>]+")
-        matches = pattern.findall(continuous_text)
-
-        for m in matches:
-            clean = m.rstrip('.,);:\'"')
-            # Sanitize: remove /tree/, /blob/, /issues/, etc. to get root repo
-            clean = re.sub(r'/(tree|blob|issues|pull|wiki|releases|commit)/.*$', '', clean)
-            github_links.append(clean)
+        # Pages are scanned in order and the scan stops at the first page
+        # with a link (papers almost always link their code on page 1);
+        # a line ending in '/' or '-' is carried over to join the next page
+        first_page_text = None
+        carry: List[str] = []
+        for page_text in self._page_texts(pdf_path):
+            if first_page_text is None:
+                first_page_text = page_text
+            repaired_lines, carry = self._repair_lines(carry + page_text.splitlines())
+            github_links.extend(self._links_in(repaired_lines))
+            if github_links:
+                break
+        else:
+            repaired_lines, _ = self._repair_lines(carry, final=True)
+            github_links.extend(self._links_in(repaired_lines))
         
         # Deduplicate while preserving order
         seen = set()
@@ -105,7 +161,7 @@ class PaperParser:
                 unique_links.append(link)
 
         if not unique_links:
-            paper_title = self._extract_paper_title(reader)
+            paper_title = self._extract_paper_title(first_page_text or "")
             if paper_title:
                 try:
                     llm_response = self._search_web(paper_title)
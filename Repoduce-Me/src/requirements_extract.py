@@ -1,7 +1,16 @@
+import ast
+import mmap
 import os
 import re
+import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Union
+
+try:
+    from packaging.requirements import InvalidRequirement, Requirement
+except ImportError:
+    Requirement = None
 
 
 class RequirementsExtractor:
@@ -26,37 +35,19 @@ class RequirementsExtractor:
         - [<deps...>]             => install via `pip install -r tmp/requirements.txt`
     """
 
-    STANDARD_LIBRARY: Set[str] = {
-        '__future__', '__main__', '_dummy_thread', '_thread', 'abc', 'aifc',
-        'antigravity', 'argparse', 'array', 'ast', 'asynchat', 'asyncio',
-        'asyncore', 'atexit', 'base64', 'bdb', 'binascii', 'binhex', 'bisect',
-        'builtins', 'bz2', 'calendar', 'cgi', 'cgitb', 'chunk', 'cmath', 'cmd',
-        'code', 'codecs', 'codeop', 'collections', 'colorsys', 'compileall',
-        'concurrent', 'configparser', 'contextlib', 'copy', 'copyreg', 'cProfile',
-        'csv', 'ctypes', 'datetime', 'dbm', 'decimal', 'difflib', 'dis',
-        'distutils', 'doctest', 'dummy_threading', 'email', 'encodings', 'errno',
-        'faulthandler', 'filecmp', 'fileinput', 'fnmatch', 'formatter', 'fractions',
-        'ftplib', 'functools', 'gc', 'getopt', 'getpass', 'gettext', 'glob', 'grp',
-        'gzip', 'hashlib', 'heapq', 'hmac', 'html', 'http', 'imaplib', 'imghdr',
-        'imp', 'importlib', 'inspect', 'io', 'ipaddress', 'itertools', 'json',
-        'keyword', 'lib2to3', 'linecache', 'locale', 'logging', 'lzma', 'mailbox',
-        'mailcap', 'marshal', 'math', 'mimetypes', 'mmap', 'modulefinder',
-        'multiprocessing', 'netrc', 'nis', 'nntplib', 'numbers', 'operator',
-        'optparse', 'os', 'ossaudiodev', 'pathlib', 'pdb', 'pickle', 'pickletools',
-        'pipes', 'pkgutil', 'platform', 'plistlib', 'poplib', 'posix', 'pprint',
-        'profile', 'pstats', 'pty', 'pwd', 'py_compile', 'pyclbr', 'pydoc',
-        'queue', 'quopri', 'random', 're', 'readline', 'reprlib', 'resource',
-        'rlcompleter', 'runpy', 'sched', 'secrets', 'select', 'selectors',
-        'shelve', 'shlex', 'shutil', 'signal', 'site', 'smtplib', 'sndhdr',
-        'socket', 'socketserver', 'spwd', 'sqlite3', 'sre_constants', 'sre_parse',
-        'ssl', 'stat', 'statistics', 'string', 'stringprep', 'struct', 'subprocess',
-        'sunau', 'symtable', 'sys', 'sysconfig', 'syslog', 'tabnanny', 'tarfile',
-        'telnetlib', 'tempfile', 'termios', 'textwrap', 'this', 'threading',
-        'time', 'timeit', 'tkinter', 'token', 'tokenize', 'trace', 'traceback',
-        'tracemalloc', 'tty', 'turtle', 'turtledemo', 'types', 'typing',
-        'unicodedata', 'unittest', 'urllib', 'uu', 'uuid', 'venv', 'warnings',
-        'wave', 'weakref', 'webbrowser', 'winreg', 'wsgiref', 'xdrlib', 'xml',
-        'xmlrpc', 'zipapp', 'zipfile', 'zipimport', 'zlib', 'zoneinfo'
+    # The running interpreter's own list (complete and O(1)), plus modules
+    # dropped from recent releases and Python 2 names that older repos still
+    # import, so they're never mistaken for PyPI packages. setuptools and
+    # pkg_resources ship in every venv.
+    STANDARD_LIBRARY: FrozenSet[str] = frozenset(sys.stdlib_module_names) | {
+        '__main__', '_dummy_thread', 'dummy_threading', 'formatter', 'binhex',
+        'parser', 'symbol', 'macpath', 'asynchat', 'asyncore', 'distutils',
+        'imp', 'smtpd', 'aifc', 'audioop', 'cgi', 'cgitb', 'chunk', 'crypt',
+        'imghdr', 'mailcap', 'msilib', 'nis', 'nntplib', 'ossaudiodev', 'pipes',
+        'sndhdr', 'spwd', 'sunau', 'telnetlib', 'uu', 'xdrlib', 'lib2to3',
+        '__builtin__', 'ConfigParser', 'Queue', 'cPickle', 'cStringIO',
+        'StringIO', 'HTMLParser', 'httplib', 'urllib2', 'urlparse', 'Tkinter',
+        'commands', 'setuptools', 'pkg_resources',
     }
 
     MODULE_TO_PACKAGE: Dict[str, str] = {
@@ -82,6 +73,10 @@ class RequirementsExtractor:
         'astropy': 'astropy',
     }
 
+    # PyPI backports of stdlib modules that break installs on Python 3
+    # (enum34 shadows the stdlib enum; futures refuses to install)
+    OBSOLETE_BACKPORTS: FrozenSet[str] = frozenset({"enum34", "futures"})
+
     REQUIREMENTS_FILES: List[str] = [
         "requirements.txt",
         "requirements-dev.txt",
@@ -102,41 +97,63 @@ class RequirementsExtractor:
         "node_modules",
     }
 
+    # Fallback for sources ast can't parse: one multiline pass over the raw
+    # bytes matching both import forms, no decoding or line splitting.
+    IMPORT_RE = re.compile(
+        rb"(?m)^[ \t]*(?:import[ \t]+([a-zA-Z0-9_\.]+)|from[ \t]+([a-zA-Z0-9_\.]+)[ \t]+import)"
+    )
+    COMMENT_RE = re.compile(r"[ \t]*#.*$")
+    MARKER_RE = re.compile(r";.*$")
+    # Leading project name of a requirement line (before extras, version
+    # specifiers or "@ url"); used when packaging isn't installed
+    REQUIREMENT_NAME_RE = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)(?![A-Za-z0-9._+:-])")
+
+    # Larger .py files are generated data or vendored bundles, not code
+    # whose imports we need
+    MAX_SCAN_FILE_BYTES: int = 2 * 1024 * 1024
+
+    # Files at least this large are memory-mapped rather than read; below it
+    # a plain read is cheaper than setting up the mapping
+    MMAP_MIN_BYTES: int = 64 * 1024
+
     def __init__(self, repo_dir: str | Path, output_dir: str | Path):
         self.repo_dir = Path(repo_dir)
         self.output_dir = Path(output_dir)
         self.output_file = self.output_dir / "requirements.txt"
         self.all_dependencies: Set[str] = set()
+        # module name -> install name, or None to drop (stdlib): one lookup per import
+        self._resolve: Dict[str, Optional[str]] = {
+            **dict.fromkeys(self.STANDARD_LIBRARY),
+            **self.MODULE_TO_PACKAGE,
+        }
 
-    def _extract_module_name(self, line: str) -> Optional[str]:
+    def _imported_modules(self, source: Union[bytes, mmap.mmap], file_path: Path) -> Set[str]:
         """
-        Extract base module name from a Python import line.
+        Return the base names of all absolute imports in a source file.
 
-        Handles:
-            - import foo
-            - import foo.bar as baz
-            - from foo.bar import x, y
+        Parses the raw bytes with ast (which honours PEP 263 encoding
+        declarations itself), so this also catches `import a, b` and imports
+        split over several lines. Files that don't parse (e.g. Python 2 code,
+        undecodable bytes) fall back to a regex scan of the bytes.
         """
-        line = line.strip()
-        if not line or line.startswith("#"):
-            return None
-
-        # 'import foo[.bar...]'
-        match_import = re.match(r"^\s*import\s+([a-zA-Z0-9_\.]+)", line)
-        if match_import:
-            module_path = match_import.group(1)
-            return module_path.split(".")[0]
-
-        # 'from foo[.bar...] import ...'
-        match_from = re.match(r"^\s*from\s+([a-zA-Z0-9_\.]+)\s+import", line)
-        if match_from:
-            module_path = match_from.group(1)
-            # Skip relative imports: from .foo import ...
-            if module_path.startswith("."):
-                return None
-            return module_path.split(".")[0]
-
-        return None
+        modules: Set[str] = set()
+        try:
+            tree = ast.parse(source, filename=str(file_path))
+        except (SyntaxError, ValueError):
+            for match in self.IMPORT_RE.finditer(source):
+                module_path = match.group(1) or match.group(2)
+                # Skip relative imports: from .foo import ...
+                if not module_path.startswith(b"."):
+                    modules.add(module_path.split(b".")[0].decode("ascii"))
+            return modules
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    modules.add(alias.name.split(".")[0])
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                modules.add(node.module.split(".")[0])
+        return modules
 
     def _is_local_import(self, module_name: str) -> bool:
         """
@@ -155,46 +172,48 @@ class RequirementsExtractor:
 
         return False
 
-    def _process_file(self, file_path: Path) -> None:
+    def _process_file(self, file_path: Path) -> Set[str]:
         """
-        Reads a Python file, extracts imports, and adds external modules to the set.
+        Reads a Python file and returns the external packages it imports.
+
+        Doesn't touch shared state, so analyze_imports can run it on many
+        files concurrently.
         """
+        packages: Set[str] = set()
+
         if not file_path.suffix == ".py":
-            return
+            return packages
 
         if file_path.name.startswith("."):
-            return
+            return packages
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            try:
-                content = file_path.read_text(encoding="latin-1")
-            except Exception as e:
-                print(f"[WARNING] Skipping file due to encoding/read error: {file_path} ({e})")
-                return
-        except Exception as e:
+            with open(file_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size < self.MMAP_MIN_BYTES:
+                    modules = self._imported_modules(f.read(), file_path)
+                else:
+                    # Parse straight from the page cache instead of copying
+                    # a large file into a bytes object first
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as source:
+                        modules = self._imported_modules(source, file_path)
+        except OSError as e:
             print(f"[WARNING] Skipping file due to read error: {file_path} ({e})")
-            return
-
-        try:
-            for line in content.splitlines():
-                module_name = self._extract_module_name(line)
-                if not module_name:
-                    continue
-
-                if module_name in self.STANDARD_LIBRARY:
-                    continue
+            return packages
+        except Exception as e:
+            print(f"[WARNING] Could not analyze imports in file {file_path}: {e}. Skipping file.")
+            return packages
 
-                if self._is_local_import(module_name):
-                    continue
+        for module_name in modules:
+            package_name = self._resolve.get(module_name, module_name)
+            if package_name is None:
+                continue
 
-                package_name = self.MODULE_TO_PACKAGE.get(module_name, module_name)
+            if self._is_local_import(module_name):
+                continue
 
-                self.all_dependencies.add(package_name)
+            packages.add(package_name)
 
-        except Exception as e:
-            print(f"[WARNING] Could not analyze imports in file {file_path}: {e}. Skipping file.")
+        return packages
 
     def _get_dependencies_from_file(self, file_path: Path) -> List[str]:
         """
@@ -209,8 +228,8 @@ class RequirementsExtractor:
                     if not line or line.startswith("#"):
                         continue
 
-                    line = re.sub(r"[ \t]*#.*$", "", line)  
-                    line = re.sub(r";.*$", "", line)         
+                    line = self.COMMENT_RE.sub("", line)
+                    line = self.MARKER_RE.sub("", line)
 
                     cleaned = line.strip()
                     if cleaned:
@@ -219,6 +238,25 @@ class RequirementsExtractor:
             print(f"[ERROR] Could not read dependency file {file_path}: {e}")
         return deps
 
+    @classmethod
+    def _requirement_name(cls, line: str) -> Optional[str]:
+        """
+        Return the normalized project name of a requirement line (lowercase,
+        '-' and '.' as '_', comparable with module names), or None for lines
+        that aren't a plain requirement (pip options such as -r/-e, bare URLs).
+        """
+        if Requirement is not None:
+            try:
+                name = Requirement(line).name
+            except InvalidRequirement:
+                return None
+        else:
+            match = cls.REQUIREMENT_NAME_RE.match(line)
+            if not match:
+                return None
+            name = match.group(1)
+        return re.sub(r"[-_.]+", "_", name).lower()
+
     def find_existing_requirements(self) -> Optional[List[str]]:
         """
         Priority:
@@ -247,10 +285,10 @@ class RequirementsExtractor:
             print(f"[INFO] Found existing dependency file: {filename}. Using contents.")
             deps = self._get_dependencies_from_file(file_path)
 
+            skipped = self.STANDARD_LIBRARY | self.OBSOLETE_BACKPORTS
             filtered = [
                 dep for dep in deps
-                if dep.split(">")[0].split("=")[0].split("<")[0].split("~")[0].strip()
-                not in self.STANDARD_LIBRARY
+                if self._requirement_name(dep) not in skipped
             ]
 
             if not filtered:
@@ -261,14 +299,58 @@ class RequirementsExtractor:
 
         return None
 
+    def iter_source_files(self) -> Iterator[Path]:
+        """
+        Lazily yield the .py files worth scanning.
+
+        The tree is walked with os.scandir, pruning IGNORE_DIRS and dot
+        directories without descending into them and skipping .py files
+        over MAX_SCAN_FILE_BYTES from the cached directory entry.
+        """
+        pending = [str(self.repo_dir)]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith("."):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if name not in self.IGNORE_DIRS:
+                                pending.append(entry.path)
+                        elif (
+                            name.endswith(".py")
+                            and entry.stat().st_size <= self.MAX_SCAN_FILE_BYTES
+                        ):
+                            yield Path(entry.path)
+                    except OSError:
+                        continue
+
     def analyze_imports(self) -> None:
-        """Walk over the repo and collect imported external modules."""
-        for root, dirs, files in os.walk(self.repo_dir):
-            dirs[:] = [d for d in dirs if d not in self.IGNORE_DIRS and not d.startswith(".")]
+        """
+        Walk over the repo and collect imported external modules.
 
-            for file_name in files:
-                file_path = Path(root) / file_name
-                self._process_file(file_path)
+        Files from iter_source_files are read and parsed on a thread pool
+        while the walk continues. At most two files per worker are in
+        flight, so memory stays flat however large the repository; each
+        worker returns its own set, merged here.
+        """
+        workers = min(32, (os.cpu_count() or 1) * 2)
+        in_flight: Set[Future] = set()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for file_path in self.iter_source_files():
+                if len(in_flight) >= workers * 2:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self.all_dependencies |= future.result()
+                in_flight.add(pool.submit(self._process_file, file_path))
+
+            for future in in_flight:
+                self.all_dependencies |= future.result()
 
     def extract(self) -> List[str]:
         """
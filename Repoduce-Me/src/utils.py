@@ -1,96 +1,138 @@
 import subprocess
-from typing import Set
+import sys
+from typing import Iterator, List, Optional, Set
 import os
 import shutil
+import stat
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
 
+from constants import RMTREE_WORKERS
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: cache entries are used without locking
+    fcntl = None
+
+# External tools resolved against PATH once at import instead of on every
+# subprocess call (which probes each PATH entry, and PATHEXT on Windows)
+GIT = shutil.which("git") or "git"
+UV = shutil.which("uv")
+CP = shutil.which("cp")
+
+# Passed as close_fds to every subprocess we start. Python opens its own
+# descriptors non-inheritable (PEP 446), so on POSIX there is nothing to
+# close in the child, and close_fds=False lets subprocess use posix_spawn
+# (when no cwd is set) instead of fork + a close loop. Windows keeps the
+# default, which stops stray handles leaking into children.
+CLOSE_FDS = os.name == "nt"
 
 
 def get_installed_packages(venv_python: str) -> Set[str]:
     """
     Get a set of installed package names from the virtual environment.
+
+    Reads the distribution metadata in the venv's site-packages directly
+    instead of starting the venv's interpreter to run `pip list`; falls back
+    to pip when no site-packages directory can be found.
     """
+    site_packages = _venv_site_packages(venv_python)
+    if site_packages:
+        packages: Set[str] = set()
+        for directory in site_packages:
+            packages |= _scan_distributions(directory)
+        return packages
+
+    return _pip_list_packages(venv_python)
+
+
+def _venv_site_packages(venv_python: str) -> List[Path]:
+    """Site-packages directories of the venv that venv_python belongs to."""
+    venv_dir = Path(venv_python).parent.parent
+    if os.name == 'nt':
+        candidates = [venv_dir / "Lib" / "site-packages"]
+    else:
+        candidates = list(venv_dir.glob("lib/python*/site-packages"))
+    return [path for path in candidates if path.is_dir()]
+
+
+def _scan_distributions(site_packages: Path) -> Set[str]:
+    """Lower-cased project names of the *.dist-info / *.egg-info entries in site_packages."""
+    packages: Set[str] = set()
+    with os.scandir(site_packages) as entries:
+        for entry in entries:
+            if entry.name.endswith(".dist-info"):
+                metadata = os.path.join(entry.path, "METADATA")
+            elif entry.name.endswith(".egg-info"):
+                metadata = os.path.join(entry.path, "PKG-INFO") if entry.is_dir() else entry.path
+            else:
+                continue
+            name = _metadata_name(metadata) or entry.name.split("-", 1)[0]
+            packages.add(name.lower())
+    return packages
+
+
+def _metadata_name(metadata_path: str) -> Optional[str]:
+    """The Name: header of a METADATA/PKG-INFO file, or None if it can't be read."""
+    try:
+        with open(metadata_path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if line.startswith("Name:"):
+                    return line[len("Name:"):].strip() or None
+                if not line.strip():
+                    # End of the header block
+                    break
+    except OSError:
+        pass
+    return None
+
+
+def _pip_list_packages(venv_python: str) -> Set[str]:
+    """Installed package names as reported by `pip list` in the venv."""
     try:
         result = subprocess.run(
             [venv_python, "-m", "pip", "list", "--format=freeze"],
             capture_output=True,
             text=True,
-            timeout=60
+            timeout=60,
+            close_fds=CLOSE_FDS
         )
         
         if result.returncode != 0:
             return set()
         
-        packages: Set[str] = set()
-        for line in result.stdout.strip().split('\n'):
-            if '==' in line:
-                pkg_name = line.split('==')[0].strip().lower()
-                packages.add(pkg_name)
-            elif line.strip():
-                packages.add(line.strip().lower())
-        
-        return packages
+        # One partition per line; lines without '==' keep their whole text
+        names = (line.partition('==')[0].strip() for line in result.stdout.splitlines())
+        return {name.lower() for name in names if name}
         
     except Exception:
         return set()
 
 
-def clone_repository(github_url: str, target_dir: str) -> bool:
-    """
-    Clone a GitHub repository to the target directory.
-    """
-    print(f"Attempting to clone '{github_url}' into '{target_dir}'...")
-    
-    if os.path.exists(target_dir):
-        shutil.rmtree(target_dir)
-    
-    try:
-        result = subprocess.run(
-            ["git", "clone", "--depth", "1", github_url, target_dir],
-            capture_output=True,
-            text=True,
-            timeout=300
-        )
-        
-        if result.returncode == 0:
-            print("Cloning successful.")
-            return True
-        else:
-            print(f"[ERROR] Git clone failed: {result.stderr}")
-            return False
-            
-    except subprocess.TimeoutExpired:
-        print("[ERROR] Git clone timed out after 300 seconds.")
-        return False
-    except FileNotFoundError:
-        print("[ERROR] Git is not installed or not in PATH.")
-        return False
-    except Exception as e:
-        print(f"[ERROR] Unexpected error during clone: {e}")
-        return False
-
-
 def run_demo(venv_python: str, demo_path: str, repo_path: str) -> bool:
     """
     Execute the generated demo script.
+
+    The demo inherits this process's stdout/stderr, so its output appears
+    as it runs instead of being buffered until it exits.
     """
     print(f"\n--- Running Demo: {demo_path} ---")
     
     try:
+        print("Demo Output:")
+        sys.stdout.flush()
+        sys.stderr.flush()
         result = subprocess.run(
             [venv_python, demo_path],
             cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=600
+            timeout=600,
+            close_fds=CLOSE_FDS
         )
         
-        print("Demo Output:")
-        print(result.stdout)
-        
-        if result.stderr:
-            print("Demo Errors:")
-            print(result.stderr)
-        
         if result.returncode == 0:
             print("[SUCCESS] Demo completed successfully!")
             return True
@@ -104,3 +146,113 @@ def run_demo(venv_python: str, demo_path: str, repo_path: str) -> bool:
     except Exception as e:
         print(f"[ERROR] Failed to run demo: {e}")
         return False
+
+
+def fast_rmtree(path, onerror=None) -> None:
+    """
+    Remove a directory tree without blocking the caller.
+
+    The tree is renamed to a sibling `<name>.trash.<uuid>` (a single rename on
+    the same filesystem, however many files the venv has) and deleted in a
+    background thread. The thread is non-daemon so the delete still finishes
+    if the interpreter is shutting down. If the rename fails, the tree is
+    removed synchronously (scandir_rmtree, then shutil.rmtree with onerror
+    for whatever it couldn't delete) and any error propagates to the caller.
+    """
+    path = Path(path)
+    trash = path.with_name(f"{path.name}.trash.{uuid.uuid4().hex}")
+
+    try:
+        os.rename(path, trash)
+    except OSError:
+        try:
+            scandir_rmtree(path)
+        except OSError:
+            shutil.rmtree(path, onerror=onerror)
+        return
+
+    threading.Thread(
+        target=parallel_rmtree,
+        args=(trash,),
+        name=f"rmtree-{path.name}",
+    ).start()
+
+
+def scandir_rmtree(path) -> None:
+    """
+    Delete a tree synchronously with one os.scandir pass per directory.
+
+    Entry types come from the scandir results, so no file is stat'ed again
+    before it is unlinked. On Windows the read-only bit (set on every git
+    object) is cleared up front instead of after a failed unlink. Raises
+    OSError on the first entry it can't remove.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                scandir_rmtree(entry.path)
+            else:
+                if os.name == "nt":
+                    os.chmod(entry.path, stat.S_IWRITE)
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+def parallel_rmtree(path, workers: int = RMTREE_WORKERS) -> None:
+    """
+    Delete a tree with its top-level subdirectories removed concurrently.
+
+    Keeping several unlink/rmdir streams in flight lets the filesystem
+    overlap metadata updates (venvs and clones are thousands of small
+    files); errors are ignored, as for a best-effort background delete.
+    """
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                else:
+                    try:
+                        os.unlink(entry.path)
+                    except OSError:
+                        pass
+    except OSError:
+        return
+
+    if subdirs:
+        with ThreadPoolExecutor(max_workers=min(workers, len(subdirs))) as pool:
+            for subdir in subdirs:
+                pool.submit(shutil.rmtree, subdir, ignore_errors=True)
+
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@contextmanager
+def cache_entry_lock(entry: Path, shared: bool = False, blocking: bool = True) -> Iterator[bool]:
+    """
+    Hold a flock on a cache entry's '<name>.lock' sidecar for the block.
+
+    Readers take it shared, writers and eviction exclusive. Yields whether
+    the lock was acquired (always True when blocking). Lock files are left
+    in place: removing one while another run has it open would let two runs
+    lock different inodes. Without fcntl no lock is taken and True is yielded.
+    """
+    if fcntl is None:
+        yield True
+        return
+
+    mode = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+    with open(entry.with_name(f"{entry.name}.lock"), "a") as lock_file:
+        try:
+            fcntl.flock(lock_file, mode | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            acquired = False
+        else:
+            acquired = True
+
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
@@ -10,8 +10,24 @@ import os
 import sys
 import subprocess
 import shutil
+import hashlib
+import threading
+import time
+from collections import deque
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Callable, Deque, Optional, Tuple, List
+
+from constants import (
+    VENV_CACHE_DIR, VENV_CACHE_MAX_ENTRIES, BASE_VENV_DIR, PIP_CACHE_DIR, UV_CACHE_DIR, WHEELHOUSE_DIR,
+    LOCK_CACHE_DIR, LOCK_MAX_AGE,
+)
+from utils import CLOSE_FDS, CP, GIT, UV, cache_entry_lock, fast_rmtree
+
+
+# Seconds before a venv/pip command is abandoned
+COMMAND_TIMEOUT = 600
+# Lines of streamed output kept for error messages
+COMMAND_TAIL_LINES = 200
 
 
 class VenvCreationError(Exception):
@@ -60,7 +76,8 @@ def run_command(
     cmd: List[str],
     cwd: Optional[str] = None,
     env: Optional[dict] = None,
-    description: str = "Command"
+    description: str = "Command",
+    stream: bool = False
 ) -> Tuple[int, str, str]:
     """
     Run a subprocess command with proper error handling.
@@ -70,10 +87,17 @@ def run_command(
         cwd: Working directory for the command.
         env: Environment variables dictionary.
         description: Human-readable description of the command.
+        stream: Echo the command's output live instead of buffering it (for
+            long pip installs). Stdout and stderr are merged; only the last
+            COMMAND_TAIL_LINES lines are kept and returned as stderr, with
+            an empty stdout.
         
     Returns:
         Tuple of (return_code, stdout, stderr)
     """
+    if stream:
+        return _run_streaming(cmd, cwd, env, description)
+    
     try:
         result = subprocess.run(
             cmd,
@@ -81,21 +105,116 @@ def run_command(
             env=env,
             capture_output=True,
             text=True,
-            timeout=600  
+            timeout=COMMAND_TIMEOUT,
+            close_fds=CLOSE_FDS
         )
         return result.returncode, result.stdout, result.stderr
     except subprocess.TimeoutExpired:
-        return -1, "", f"{description} timed out after 600 seconds"
+        return -1, "", f"{description} timed out after {COMMAND_TIMEOUT} seconds"
     except Exception as e:
         return -1, "", f"{description} failed with exception: {str(e)}"
 
 
+def _run_streaming(
+    cmd: List[str],
+    cwd: Optional[str],
+    env: Optional[dict],
+    description: str
+) -> Tuple[int, str, str]:
+    """run_command(stream=True): echo output line by line, keep a bounded tail."""
+    tail: Deque[str] = deque(maxlen=COMMAND_TAIL_LINES)
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+            bufsize=1,
+            close_fds=CLOSE_FDS
+        )
+    except Exception as e:
+        return -1, "", f"{description} failed with exception: {str(e)}"
+    
+    def pump() -> None:
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            tail.append(line)
+        sys.stdout.flush()
+    
+    reader = threading.Thread(target=pump, daemon=True)
+    reader.start()
+    try:
+        returncode = proc.wait(timeout=COMMAND_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        reader.join(timeout=5)
+        return -1, "", f"{description} timed out after {COMMAND_TIMEOUT} seconds"
+    except BaseException:
+        # Ctrl-C: don't leave pip running behind us
+        proc.kill()
+        proc.wait()
+        raise
+    reader.join(timeout=5)
+    return returncode, "", "".join(tail)
+
+
+def pip_env() -> dict:
+    """
+    Environment for pip runs inside a venv.
+    
+    Points pip at the persistent PIP_CACHE_DIR (uv at UV_CACHE_DIR) so
+    wheels downloaded or built for one paper are reused by the next run
+    instead of being fetched again, and makes it prefer those wheels (and
+    any in WHEELHOUSE_DIR, for pip and uv alike) over building sdists.
+    Settings the caller already made, e.g. batch_eval's, are kept.
+    
+    Returns:
+        A copy of os.environ with the pip settings applied.
+    """
+    env = os.environ.copy()
+    env["SETUPTOOLS_USE_DISTUTILS"] = "stdlib"
+    env.setdefault("PIP_CACHE_DIR", str(PIP_CACHE_DIR))
+    env.setdefault("PIP_PREFER_BINARY", "1")
+    env.setdefault("PIP_DISABLE_PIP_VERSION_CHECK", "1")
+    env.setdefault("PIP_NO_INPUT", "1")
+    # uv ignores PIP_* variables; give it its own cache and the same wheelhouse
+    env.setdefault("UV_CACHE_DIR", str(UV_CACHE_DIR))
+    if WHEELHOUSE_DIR.is_dir():
+        env.setdefault("PIP_FIND_LINKS", str(WHEELHOUSE_DIR))
+        env.setdefault("UV_FIND_LINKS", env["PIP_FIND_LINKS"])
+    return env
+
+
+def pip_install_command(venv_python: str, args: List[str]) -> List[str]:
+    """
+    Build an install command targeting a virtual environment.
+    
+    Uses `uv pip install` when uv is on PATH (parallel downloads and installs,
+    resolver and cache shared across runs), otherwise `python -m pip install`.
+    Every install in this module goes through here.
+    
+    Args:
+        venv_python: Path to the venv's Python executable.
+        args: Arguments following `pip install`.
+        
+    Returns:
+        Command and arguments as a list.
+    """
+    if UV:
+        return [UV, "pip", "install", "--python", venv_python] + args
+    return [venv_python, "-m", "pip", "install"] + args
+
+
 def create_virtual_environment(
     venv_path: str,
     python_executable: Optional[str] = None
 ) -> str:
     """
-    Create a new virtual environment.
+    Create a new virtual environment (with `uv venv` when uv is on PATH).
     
     Args:
         venv_path: Path where the virtual environment should be created.
@@ -112,14 +231,17 @@ def create_virtual_environment(
     
     if os.path.exists(venv_path):
         print(f"[INFO] Removing existing virtual environment at {venv_path}...")
-        shutil.rmtree(venv_path)
+        fast_rmtree(venv_path)
     
     print(f"[INFO] Creating virtual environment at {venv_path} using {python_executable}...")
     
-    returncode, stdout, stderr = run_command(
-        [python_executable, "-m", "venv", venv_path],
-        description="venv creation"
-    )
+    if UV:
+        # --seed still puts pip in the venv for tools that expect it
+        cmd = [UV, "venv", "--seed", "--python", python_executable, venv_path]
+    else:
+        cmd = [python_executable, "-m", "venv", venv_path]
+    
+    returncode, stdout, stderr = run_command(cmd, env=pip_env(), description="venv creation")
     
     if returncode != 0:
         raise VenvCreationError(f"Failed to create virtual environment: {stderr}")
@@ -154,46 +276,93 @@ def upgrade_build_tools(venv_python: str) -> None:
     """
     print("[INFO] Upgrading pip, setuptools, and wheel in the virtual environment...")
     
-    env = os.environ.copy()
-    env["SETUPTOOLS_USE_DISTUTILS"] = "stdlib"
+    env = pip_env()
     
     returncode, stdout, stderr = run_command(
-        [venv_python, "-m", "pip", "install", "--upgrade", 
-         "pip", "setuptools", "wheel"],
+        pip_install_command(venv_python, ["--upgrade", "pip", "setuptools", "wheel"]),
         env=env,
-        description="build tools upgrade"
+        description="build tools upgrade",
+        stream=True
     )
     
     if returncode != 0:
-        print(f"[WARNING] Build tools upgrade had issues: {stderr}")
+        print(f"[WARNING] Build tools upgrade had issues: {stderr[-300:]}")
     else:
         print("[SUCCESS] Core build tools upgraded.")
 
 
-def preinstall_build_dependencies(venv_python: str, dependencies: List[str]) -> None:
+def prepare_build_environment(venv_python: str, preinstall_deps: List[str]) -> bool:
+    """
+    Upgrade the build tools and pre-install preinstall_deps in a single pip
+    run, so pip starts and resolves once instead of once per package.
+    
+    If the combined install fails, falls back to upgrade_build_tools and
+    per-package preinstall_build_dependencies to find out which package
+    is at fault.
+    
+    Args:
+        venv_python: Path to the venv's Python executable.
+        preinstall_deps: List of package names to pre-install.
+        
+    Returns:
+        True if every dependency was installed.
+    """
+    if not preinstall_deps:
+        upgrade_build_tools(venv_python)
+        return True
+    
+    print(
+        "[INFO] Upgrading pip, setuptools, and wheel and pre-installing "
+        f"{', '.join(preinstall_deps)} in the virtual environment..."
+    )
+    returncode, stdout, stderr = run_command(
+        pip_install_command(
+            venv_python, ["--upgrade", "pip", "setuptools", "wheel"] + preinstall_deps
+        ),
+        env=pip_env(),
+        description="build tools upgrade and pre-install",
+        stream=True
+    )
+    if returncode == 0:
+        print("[SUCCESS] Core build tools upgraded and build dependencies pre-installed.")
+        return True
+    
+    print(f"[WARNING] Combined install failed, retrying step by step: {stderr[-300:]}")
+    upgrade_build_tools(venv_python)
+    return preinstall_build_dependencies(venv_python, preinstall_deps)
+
+
+def preinstall_build_dependencies(venv_python: str, dependencies: List[str]) -> bool:
     """
     Pre-install critical build dependencies that are commonly needed.
     
     Args:
         venv_python: Path to the venv's Python executable.
         dependencies: List of package names to pre-install.
+        
+    Returns:
+        True if every dependency was installed.
     """
-    env = os.environ.copy()
-    env["SETUPTOOLS_USE_DISTUTILS"] = "stdlib"
+    env = pip_env()
     
     print(f"[INFO] Pre-installing critical build dependencies: {', '.join(dependencies)}...")
     
+    all_installed = True
     for dep in dependencies:
         returncode, stdout, stderr = run_command(
-            [venv_python, "-m", "pip", "install", "--no-cache-dir", dep],
+            pip_install_command(venv_python, [dep]),
             env=env,
-            description=f"pre-install {dep}"
+            description=f"pre-install {dep}",
+            stream=True
         )
         
         if returncode == 0:
             print(f"[SUCCESS] '{dep}' pre-installed.")
         else:
-            print(f"[WARNING] Failed to pre-install '{dep}': {stderr[:200]}")
+            print(f"[WARNING] Failed to pre-install '{dep}': {stderr[-200:]}")
+            all_installed = False
+    
+    return all_installed
 
 
 def detect_install_method(repo_path: str) -> str:
@@ -238,16 +407,16 @@ def install_from_pyproject_or_setup(
     Returns:
         True if installation succeeded, False otherwise.
     """
-    env = os.environ.copy()
-    env["SETUPTOOLS_USE_DISTUTILS"] = "stdlib"
+    env = pip_env()
     
     if editable:
         print(f"[INFO] Attempting editable install from {repo_path}...")
         returncode, stdout, stderr = run_command(
-            [venv_python, "-m", "pip", "install", "--no-cache-dir", "-e", "."],
+            pip_install_command(venv_python, ["-e", "."]),
             cwd=repo_path,
             env=env,
-            description="editable install"
+            description="editable install",
+            stream=True
         )
         
         if returncode == 0:
@@ -255,36 +424,38 @@ def install_from_pyproject_or_setup(
             return True
         else:
             print(f"[WARNING] Editable install failed, trying regular install...")
-            print(f"  Error: {stderr[:300]}")
+            print(f"  Error: {stderr[-300:]}")
     
     # Strategy 2: Regular install without build isolation
     print(f"[INFO] Installing dependencies using 'pip install .' from {repo_path}...")
     returncode, stdout, stderr = run_command(
-        [venv_python, "-m", "pip", "install", "--no-cache-dir", "--no-build-isolation", "."],
+        pip_install_command(venv_python, ["--no-build-isolation", "."]),
         cwd=repo_path,
         env=env,
-        description="regular install (no build isolation)"
+        description="regular install (no build isolation)",
+        stream=True
     )
     
     if returncode == 0:
         print("[SUCCESS] Package installed successfully.")
         return True
     
-    print(f"[WARNING] Regular install failed: {stderr[:300]}")
+    print(f"[WARNING] Regular install failed: {stderr[-300:]}")
     
     print("[INFO] Retrying with build isolation...")
     returncode, stdout, stderr = run_command(
-        [venv_python, "-m", "pip", "install", "--no-cache-dir", "."],
+        pip_install_command(venv_python, ["."]),
         cwd=repo_path,
         env=env,
-        description="install with build isolation"
+        description="install with build isolation",
+        stream=True
     )
     
     if returncode == 0:
         print("[SUCCESS] Package installed with build isolation.")
         return True
     
-    print(f"[WARNING] Build isolation install failed: {stderr[:300]}")
+    print(f"[WARNING] Build isolation install failed: {stderr[-300:]}")
     
     pyproject_path = Path(repo_path) / "pyproject.toml"
     if pyproject_path.exists():
@@ -292,9 +463,10 @@ def install_from_pyproject_or_setup(
         deps = extract_dependencies_from_pyproject(str(pyproject_path))
         if deps:
             returncode, stdout, stderr = run_command(
-                [venv_python, "-m", "pip", "install", "--no-cache-dir"] + deps,
+                pip_install_command(venv_python, deps),
                 env=env,
-                description="install extracted dependencies"
+                description="install extracted dependencies",
+                stream=True
             )
             if returncode == 0:
                 print("[SUCCESS] Dependencies from pyproject.toml installed.")
@@ -342,42 +514,413 @@ def extract_dependencies_from_pyproject(pyproject_path: str) -> List[str]:
         return []
 
 
-def install_from_requirements(venv_python: str, repo_path: str) -> bool:
+def compile_requirements_lock(
+    venv_python: str,
+    requirements_file: str,
+    fingerprint: str
+) -> Optional[str]:
+    """
+    Resolve a requirements file into a fully pinned lock with `uv pip compile`.
+    
+    Locks are cached in LOCK_CACHE_DIR keyed by the file's contents and the
+    venv's interpreter, so a later venv build for the same requirements
+    installs exact pins with --no-deps and skips dependency resolution.
+    Locks older than LOCK_MAX_AGE are recompiled, so unpinned requirements
+    still move to new releases. Files with pip options (-r, -e, -c, ...) are
+    not locked, since their contents alone don't determine the result.
+    
+    Args:
+        venv_python: Path to the venv's Python executable (resolution target).
+        requirements_file: Requirements file to compile.
+        fingerprint: _interpreter_fingerprint() of the venv's base interpreter.
+        
+    Returns:
+        Path to the lock file, or None when uv is unavailable or compiling fails.
+    """
+    if not UV:
+        return None
+    
+    try:
+        data = Path(requirements_file).read_bytes()
+    except OSError:
+        return None
+    if any(line.lstrip().startswith(b"-") for line in data.splitlines()):
+        return None
+    
+    digest = hashlib.blake2b(data, digest_size=16)
+    digest.update(fingerprint.encode())
+    lock = LOCK_CACHE_DIR / f"{digest.hexdigest()}.txt"
+    try:
+        age = time.time() - lock.stat().st_mtime
+    except OSError:
+        age = None
+    if age is not None and age < LOCK_MAX_AGE:
+        print(f"[CACHE] Using cached requirements lock {lock}")
+        return str(lock)
+    
+    LOCK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    staging = lock.with_name(f"{lock.name}.partial.{os.getpid()}")
+    print("[INFO] Compiling requirements lock with uv...")
+    returncode, _, stderr = run_command(
+        [UV, "pip", "compile", "--quiet", "--no-header", "--python", venv_python, requirements_file, "-o", str(staging)],
+        env=pip_env(),
+        description="requirements lock compile"
+    )
+    if returncode != 0:
+        print(f"[WARNING] Could not compile requirements lock: {stderr[-300:]}")
+        staging.unlink(missing_ok=True)
+        return None
+    
+    os.replace(staging, lock)
+    return str(lock)
+
+
+def install_from_requirements(
+    venv_python: str,
+    repo_path: str,
+    requirements_file: Optional[str] = None,
+    use_cache: bool = True,
+    fingerprint: Optional[str] = None
+) -> bool:
     """
     Install dependencies from requirements.txt.
     
     Args:
         venv_python: Path to the venv's Python executable.
         repo_path: Path to the repository.
+        requirements_file: Requirements file to install instead of the
+            repository's own requirements.txt.
+        use_cache: Install from a cached (or newly compiled) requirements
+            lock when uv is available; False always resolves afresh.
+        fingerprint: _interpreter_fingerprint() of the venv's base
+            interpreter, keying the lock. No lock is used without it.
         
     Returns:
         True if installation succeeded, False otherwise.
     """
-    env = os.environ.copy()
-    env["SETUPTOOLS_USE_DISTUTILS"] = "stdlib"
+    env = pip_env()
+    
+    if requirements_file is None:
+        requirements_file = os.path.join(repo_path, "requirements.txt")
+    
+    # Pinned locks install without running the resolver; the source-build
+    # retry below goes back to the unpinned file in case the lock is at fault
+    lock = None
+    if use_cache and fingerprint:
+        lock = compile_requirements_lock(venv_python, requirements_file, fingerprint)
+    install_args = ["--no-deps", "-r", lock] if lock else ["-r", requirements_file]
+    
+    # Wheels only first: resolution fails fast when something has no
+    # wheel, instead of spending minutes compiling it
+    print(f"[INFO] Installing from requirements.txt (wheels only)...")
+    returncode, stdout, stderr = run_command(
+        pip_install_command(venv_python, ["--only-binary=:all:"] + install_args),
+        env=env,
+        description="requirements.txt install (wheels only)",
+        stream=True
+    )
     
-    requirements_file = os.path.join(repo_path, "requirements.txt")
+    if returncode == 0:
+        print("[SUCCESS] Requirements installed successfully.")
+        return True
     
-    print(f"[INFO] Installing from requirements.txt...")
+    print("[WARNING] Wheel-only install failed, retrying with source builds allowed...")
     returncode, stdout, stderr = run_command(
-        [venv_python, "-m", "pip", "install", "--no-cache-dir", "-r", requirements_file],
+        pip_install_command(venv_python, ["-r", requirements_file]),
         env=env,
-        description="requirements.txt install"
+        description="requirements.txt install",
+        stream=True
     )
     
     if returncode == 0:
         print("[SUCCESS] Requirements installed successfully.")
         return True
     
-    print(f"[ERROR] Failed to install requirements: {stderr[:500]}")
+    print(f"[ERROR] Failed to install requirements: {stderr[-500:]}")
     return False
 
 
+def _copy_tree(source: str, target: str) -> None:
+    """
+    Copy a directory tree, preserving symlinks.
+
+    Uses `cp --reflink=auto` where available so copy-on-write filesystems
+    share blocks instead of duplicating them.
+    """
+    if os.name != 'nt' and CP:
+        returncode, _, stderr = run_command(
+            [CP, "-a", "--reflink=auto", source, target],
+            description="venv copy"
+        )
+        if returncode == 0:
+            return
+        shutil.rmtree(target, ignore_errors=True)
+    shutil.copytree(source, target, symlinks=True)
+
+
+def _interpreter_fingerprint(python_executable: str) -> Optional[str]:
+    """Return the interpreter's real path and full version string, or None if it doesn't run."""
+    returncode, stdout, _ = run_command(
+        [python_executable, "-c", "import sys; print(sys.version)"],
+        description="Python version check"
+    )
+    if returncode != 0:
+        return None
+    return os.path.realpath(python_executable) + "\n" + stdout
+
+
+def compute_venv_cache_key(
+    repo_path: str,
+    python_executable: str,
+    install_method: str,
+    preinstall_deps: List[str],
+    requirements_file: Optional[str] = None,
+    fingerprint: Optional[str] = None
+) -> Optional[str]:
+    """
+    Hash everything that determines the contents of the installed venv.
+    
+    Args:
+        repo_path: Path to the repository.
+        python_executable: Python interpreter the venv is created from.
+        install_method: Result of detect_install_method().
+        preinstall_deps: Packages pre-installed before the main installation.
+        requirements_file: Requirements file installed instead of the
+            repository's own dependency files, if any.
+        fingerprint: _interpreter_fingerprint(python_executable), if the
+            caller already has it.
+        
+    Returns:
+        Hex digest, or None when the venv cannot be cached safely (the
+        repository itself is installed but its revision is unknown).
+    """
+    if fingerprint is None:
+        fingerprint = _interpreter_fingerprint(python_executable)
+    if fingerprint is None:
+        return None
+    
+    digest = hashlib.sha256()
+    digest.update(fingerprint.encode())
+    digest.update(install_method.encode())
+    digest.update("\n".join(sorted(preinstall_deps)).encode())
+    
+    for filename in ("pyproject.toml", "setup.py", "setup.cfg", "requirements.txt"):
+        dep_file = Path(repo_path) / filename
+        if dep_file.is_file():
+            digest.update(filename.encode())
+            digest.update(dep_file.read_bytes())
+    
+    if requirements_file:
+        digest.update(Path(requirements_file).read_bytes())
+    
+    if install_method in ('pyproject', 'setup'):
+        # `pip install .` copies the repository code itself into the venv
+        returncode, stdout, _ = run_command(
+            [GIT, "-C", repo_path, "rev-parse", "HEAD"],
+            description="git revision lookup"
+        )
+        if returncode != 0:
+            return None
+        digest.update(stdout.strip().encode())
+    
+    return digest.hexdigest()
+
+
+def restore_cached_venv(cache_key: str, venv_path: str) -> bool:
+    """
+    Copy a cached venv into venv_path and point its scripts at the new location.
+    
+    Args:
+        cache_key: Key from compute_venv_cache_key().
+        venv_path: Path where the virtual environment should be restored.
+        
+    Returns:
+        True if the cached venv was restored and its Python works.
+    """
+    cached = VENV_CACHE_DIR / cache_key
+    if not (cached / ".repro_origin").is_file():
+        return False
+    
+    # Shared lock: concurrent restores are fine, eviction waits them out
+    with cache_entry_lock(cached, shared=True):
+        if not (cached / ".repro_origin").is_file():
+            # Evicted while we waited
+            return False
+        
+        print(f"[CACHE] Restoring cached virtual environment from {cached}...")
+        try:
+            # Mark the entry as recently used for LRU eviction
+            os.utime(cached)
+        except OSError:
+            return False
+        return _restore_venv_copy(cached, venv_path)
+
+
+def _restore_venv_copy(cached: Path, venv_path: str) -> bool:
+    """Copy a stored venv (cache entry or base template) to venv_path and relocate it."""
+    origin_file = cached / ".repro_origin"
+    try:
+        if os.path.exists(venv_path):
+            fast_rmtree(venv_path)
+        _copy_tree(str(cached), venv_path)
+        
+        origin = origin_file.read_text(encoding="utf-8").strip()
+        _relocate_venv(venv_path, origin)
+    except OSError as e:
+        # Treated as a cache miss: the caller builds the venv from scratch
+        print(f"[WARNING] Could not restore cached virtual environment: {e}")
+        fast_rmtree(venv_path, onerror=lambda *args: None)
+        return False
+    
+    venv_python = get_venv_python(venv_path)
+    returncode, _, stderr = run_command(
+        [venv_python, "--version"],
+        description="cached venv Python check"
+    )
+    if returncode != 0:
+        print(f"[WARNING] Cached virtual environment is not usable: {stderr}")
+        fast_rmtree(venv_path, onerror=lambda *args: None)
+        return False
+    
+    return True
+
+
+def _relocate_venv(venv_path: str, origin: str) -> None:
+    """Rewrite absolute references to the venv's original location (shebangs, activate scripts, pyvenv.cfg)."""
+    target = os.path.abspath(venv_path)
+    if origin == target:
+        return
+    
+    scripts_dir = Path(venv_path) / ('Scripts' if os.name == 'nt' else 'bin')
+    candidates = [Path(venv_path) / "pyvenv.cfg"]
+    if scripts_dir.is_dir():
+        candidates.extend(p for p in scripts_dir.iterdir() if p.is_file() and not p.is_symlink())
+    
+    old, new = origin.encode(), target.encode()
+    for path in candidates:
+        try:
+            data = path.read_bytes()
+        except OSError:
+            continue
+        if old in data and b"\0" not in data:
+            path.write_bytes(data.replace(old, new))
+
+
+def store_venv_in_cache(cache_key: str, venv_path: str) -> None:
+    """
+    Copy a freshly built venv into the cache.
+    
+    Args:
+        cache_key: Key from compute_venv_cache_key().
+        venv_path: Path to the virtual environment that was just built.
+    """
+    cached = VENV_CACHE_DIR / cache_key
+    if cached.exists():
+        return
+    
+    VENV_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    staging = VENV_CACHE_DIR / f"{cache_key}.partial.{os.getpid()}"
+    
+    try:
+        shutil.rmtree(staging, ignore_errors=True)
+        _copy_tree(venv_path, str(staging))
+        (staging / ".repro_origin").write_text(os.path.abspath(venv_path), encoding="utf-8")
+        os.rename(staging, cached)
+        print(f"[CACHE] Virtual environment cached at {cached}")
+    except OSError as e:
+        print(f"[WARNING] Could not cache virtual environment: {e}")
+        shutil.rmtree(staging, ignore_errors=True)
+        return
+    
+    _evict_venv_cache(keep=cached)
+
+
+def _evict_venv_cache(keep: Path) -> None:
+    """
+    Remove least-recently-used cached venvs beyond VENV_CACHE_MAX_ENTRIES,
+    skipping entries another run is restoring from (their lock is held).
+    """
+    entries = []
+    for entry in os.scandir(VENV_CACHE_DIR):
+        if not entry.is_dir(follow_symlinks=False) or ".partial." in entry.name:
+            continue
+        entries.append((entry.stat().st_mtime, Path(entry.path)))
+    
+    excess = len(entries) - VENV_CACHE_MAX_ENTRIES
+    for _, path in sorted(entries, key=lambda e: e[0]):
+        if excess <= 0:
+            break
+        if path == keep:
+            continue
+        with cache_entry_lock(path, blocking=False) as locked:
+            if not locked:
+                continue
+            print(f"[CACHE] Evicting cached virtual environment: {path}")
+            fast_rmtree(str(path), onerror=lambda *args: None)
+        excess -= 1
+
+
+def ensure_base_venv(
+    python_executable: str,
+    preinstall_deps: List[str],
+    fingerprint: Optional[str] = None
+) -> Optional[Path]:
+    """
+    Return a template venv with upgraded build tools and preinstall_deps,
+    building it on first use.
+    
+    The template is keyed by interpreter and preinstall list, so every repo
+    that misses the full venv cache starts from a copy of it instead of
+    re-resolving numpy/scipy.
+    
+    Args:
+        python_executable: Python interpreter the venv is created from.
+        preinstall_deps: Packages pre-installed into the template.
+        fingerprint: _interpreter_fingerprint(python_executable), if the
+            caller already has it.
+        
+    Returns:
+        Path to the template, or None if it could not be built.
+    """
+    if fingerprint is None:
+        fingerprint = _interpreter_fingerprint(python_executable)
+    if fingerprint is None:
+        return None
+    
+    key = hashlib.sha256(
+        (fingerprint + "\n".join(sorted(preinstall_deps))).encode()
+    ).hexdigest()
+    base = BASE_VENV_DIR / key
+    if (base / ".repro_origin").is_file():
+        return base
+    
+    print(f"[CACHE] Building base virtual environment template at {base}...")
+    BASE_VENV_DIR.mkdir(parents=True, exist_ok=True)
+    staging = BASE_VENV_DIR / f"{key}.partial.{os.getpid()}"
+    
+    try:
+        venv_python = create_virtual_environment(str(staging), python_executable)
+        if not prepare_build_environment(venv_python, preinstall_deps):
+            # Don't keep a template that would silently lack these packages
+            shutil.rmtree(staging, ignore_errors=True)
+            return None
+        (staging / ".repro_origin").write_text(str(staging.resolve()), encoding="utf-8")
+        os.rename(staging, base)
+    except (VenvCreationError, OSError) as e:
+        print(f"[WARNING] Could not build base virtual environment: {e}")
+        shutil.rmtree(staging, ignore_errors=True)
+        return base if (base / ".repro_origin").is_file() else None
+    
+    return base
+
+
 def setup_venv_and_install(
     venv_path: str,
     repo_path: str,
     python_executable: Optional[str] = None,
-    preinstall_deps: Optional[List[str]] = None
+    preinstall_deps: Optional[List[str]] = None,
+    use_cache: bool = True,
+    extracted_requirements: Optional[Callable[[], Optional[str]]] = None
 ) -> Tuple[bool, str]:
     """
     Main function to create venv and install all dependencies.
@@ -387,6 +930,11 @@ def setup_venv_and_install(
         repo_path: Path to the cloned repository.
         python_executable: Python interpreter to use. Defaults to sys.executable.
         preinstall_deps: List of packages to pre-install before main installation.
+        use_cache: Reuse (and populate) the venv cache in VENV_CACHE_DIR and
+            the base template in BASE_VENV_DIR.
+        extracted_requirements: Returns the path of the requirements file
+            written by RequirementsExtractor (or None). Only called when the
+            repository has no dependency file of its own.
         
     Returns:
         Tuple of (success: bool, venv_python_path: str)
@@ -394,27 +942,63 @@ def setup_venv_and_install(
     if preinstall_deps is None:
         preinstall_deps = ["numpy", "scipy"]
     
+    if python_executable is None:
+        python_executable = sys.executable
+    
     try:
-        venv_python = create_virtual_environment(venv_path, python_executable)
+        install_method = detect_install_method(repo_path)
         
-        upgrade_build_tools(venv_python)
+        requirements_file = None
+        if install_method == 'none' and extracted_requirements is not None:
+            requirements_file = extracted_requirements()
+            if requirements_file:
+                print(f"[INFO] Using extracted requirements: {requirements_file}")
+                install_method = 'extracted'
         
-        if preinstall_deps:
-            preinstall_build_dependencies(venv_python, preinstall_deps)
+        # One interpreter check per venv, shared by the venv cache key and the
+        # requirements lock
+        fingerprint = _interpreter_fingerprint(python_executable) if use_cache else None
         
-        install_method = detect_install_method(repo_path)
+        cache_key = None
+        if fingerprint is not None:
+            cache_key = compute_venv_cache_key(
+                repo_path, python_executable, install_method, preinstall_deps,
+                requirements_file, fingerprint
+            )
+            if cache_key and restore_cached_venv(cache_key, venv_path):
+                print(f"[SUCCESS] Virtual environment restored from cache at: {venv_path}")
+                return True, get_venv_python(venv_path)
+        
+        base = ensure_base_venv(python_executable, preinstall_deps, fingerprint) if use_cache else None
+        
+        if base is not None and _restore_venv_copy(base, venv_path):
+            print(f"[CACHE] Started from base virtual environment template {base}")
+            venv_python = get_venv_python(venv_path)
+        else:
+            venv_python = create_virtual_environment(venv_path, python_executable)
+            
+            prepare_build_environment(venv_python, preinstall_deps)
         
         success = False
         
         if install_method in ('pyproject', 'setup'):
             success = install_from_pyproject_or_setup(venv_python, repo_path)
         elif install_method == 'requirements':
-            success = install_from_requirements(venv_python, repo_path)
+            success = install_from_requirements(
+                venv_python, repo_path, use_cache=use_cache, fingerprint=fingerprint
+            )
+        elif install_method == 'extracted':
+            success = install_from_requirements(
+                venv_python, repo_path, requirements_file,
+                use_cache=use_cache, fingerprint=fingerprint
+            )
         else:
             print("[WARNING] No installation method detected. Venv created but no deps installed.")
             success = True
         
         if success:
+            if cache_key:
+                store_venv_in_cache(cache_key, venv_path)
             print(f"[SUCCESS] Virtual environment ready at: {venv_path}")
             return True, venv_python
         else:
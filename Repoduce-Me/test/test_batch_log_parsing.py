@@ -0,0 +1,44 @@
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from batch_eval import detect_last_step, extract_last_error_line, scan_log
+
+
+class ScanLogTest(unittest.TestCase):
+    def test_detects_highest_step_marker(self):
+        log = "--- STEP 1: Loading PDF ---\n...\n--- step 3: Cloning ---\n[INFO] done\n"
+        hits = scan_log(log)
+        self.assertIn("--- step 3:", hits)
+        self.assertEqual(detect_last_step(hits), 3)
+
+    def test_no_markers_is_step_zero(self):
+        self.assertEqual(detect_last_step(scan_log("nothing to see here\n")), 0)
+
+    def test_keywords_are_lowercased(self):
+        hits = scan_log("Traceback...\nModuleNotFoundError: No module named 'x'\n")
+        self.assertIn("modulenotfounderror", hits)
+
+
+class ExtractLastErrorLineTest(unittest.TestCase):
+    def test_returns_last_error_line(self):
+        log = "[ERROR] first\n[INFO] ok\n[FATAL] second problem\n[INFO] tail\n"
+        self.assertEqual(extract_last_error_line(log), "[FATAL] second problem")
+
+    def test_carriage_returns_split_lines(self):
+        # git/pip progress redraws lines with \r; only the error itself is wanted
+        log = "Receiving objects:  50%\rReceiving objects: 100%\r[ERROR] Git clone failed\rmore progress\n"
+        self.assertEqual(extract_last_error_line(log), "[ERROR] Git clone failed")
+
+    def test_error_at_end_without_newline(self):
+        self.assertEqual(extract_last_error_line("[INFO] x\n[ERROR] boom"), "[ERROR] boom")
+
+    def test_no_error(self):
+        self.assertEqual(extract_last_error_line("[INFO] all good\n"), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
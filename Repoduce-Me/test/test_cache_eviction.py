@@ -0,0 +1,97 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+import downloader
+import utils
+import venv_create
+from utils import cache_entry_lock
+
+
+def make_entry(cache_dir: Path, name: str, mtime: int, size: int = 0) -> Path:
+    """Create a cache entry directory with a given age and recorded size."""
+    entry = cache_dir / name
+    entry.mkdir()
+    (entry / ".repro_origin").write_text("/nowhere", encoding="utf-8")
+    entry.with_name(f"{name}.size").write_text(str(size), encoding="utf-8")
+    os.utime(entry, (mtime, mtime))
+    return entry
+
+
+class CloneCacheEvictionTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = Path(self.tmp.name)
+        patcher = mock.patch.multiple(downloader, CLONE_CACHE_DIR=self.cache, CLONE_CACHE_MAX_BYTES=100)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_evicts_oldest_until_under_budget(self):
+        old = make_entry(self.cache, "old", 1000, size=80)
+        new = make_entry(self.cache, "new", 2000, size=80)
+        downloader.Downloader()._evict_clone_cache(keep=new)
+        self.assertFalse(old.exists())
+        self.assertFalse(old.with_name("old.size").exists())
+        self.assertTrue(new.exists())
+
+    def test_keep_entry_is_never_evicted(self):
+        kept = make_entry(self.cache, "kept", 1000, size=80)
+        other = make_entry(self.cache, "other", 2000, size=80)
+        downloader.Downloader()._evict_clone_cache(keep=kept)
+        self.assertTrue(kept.exists())
+        self.assertFalse(other.exists())
+
+    @unittest.skipIf(utils.fcntl is None, "no flock on this platform")
+    def test_locked_entry_is_skipped(self):
+        locked = make_entry(self.cache, "locked", 1000, size=80)
+        new = make_entry(self.cache, "new", 2000, size=80)
+        with cache_entry_lock(locked, shared=True):
+            downloader.Downloader()._evict_clone_cache(keep=new)
+            self.assertTrue(locked.exists())
+        downloader.Downloader()._evict_clone_cache(keep=new)
+        self.assertFalse(locked.exists())
+
+    def test_recency_uses_mtime_not_atime(self):
+        # A recently-read (high atime) but long-unused entry is still the oldest
+        stale = make_entry(self.cache, "stale", 1000, size=80)
+        os.utime(stale, (5000, 1000))
+        fresh = make_entry(self.cache, "fresh", 2000, size=80)
+        downloader.Downloader()._evict_clone_cache(keep=Path("/none"))
+        self.assertFalse(stale.exists())
+        self.assertTrue(fresh.exists())
+
+
+class VenvCacheEvictionTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = Path(self.tmp.name)
+        patcher = mock.patch.multiple(venv_create, VENV_CACHE_DIR=self.cache, VENV_CACHE_MAX_ENTRIES=1)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_keeps_newest_entries(self):
+        old = make_entry(self.cache, "old", 1000)
+        new = make_entry(self.cache, "new", 2000)
+        venv_create._evict_venv_cache(keep=new)
+        self.assertFalse(old.exists())
+        self.assertTrue(new.exists())
+
+    @unittest.skipIf(utils.fcntl is None, "no flock on this platform")
+    def test_entry_being_restored_is_skipped(self):
+        restoring = make_entry(self.cache, "restoring", 1000)
+        new = make_entry(self.cache, "new", 2000)
+        with cache_entry_lock(restoring, shared=True):
+            venv_create._evict_venv_cache(keep=new)
+            self.assertTrue(restoring.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
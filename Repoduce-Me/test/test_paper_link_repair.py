@@ -0,0 +1,60 @@
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+try:
+    from paper_extracter import PaperParser
+except ImportError:  # PyPDF2 / the Constructor adapter not installed
+    PaperParser = None
+
+requires_parser = unittest.skipIf(PaperParser is None, "paper_extracter unavailable")
+
+
+def paged_parser(pages):
+    """A PaperParser reading page texts from a list instead of a PDF."""
+    parser = PaperParser(b"%PDF-")
+    parser._page_texts = lambda pdf: iter(pages)
+    return parser
+
+
+@requires_parser
+class RepairLinesTest(unittest.TestCase):
+    def test_joins_line_ending_in_slash(self):
+        parser = PaperParser()
+        lines, leftover = parser._repair_lines(["see https://github.com/", "owner/repo now"])
+        self.assertEqual(lines, ["see https://github.com/owner/repo now"])
+        self.assertEqual(leftover, [])
+
+    def test_trailing_continuation_is_carried_unless_final(self):
+        parser = PaperParser()
+        lines, leftover = parser._repair_lines(["intro", "https://github.com/owner/"])
+        self.assertEqual(lines, ["intro"])
+        self.assertEqual(leftover, ["https://github.com/owner/"])
+
+        lines, leftover = parser._repair_lines(["https://github.com/owner/"], final=True)
+        self.assertEqual(lines, ["https://github.com/owner/"])
+        self.assertEqual(leftover, [])
+
+
+@requires_parser
+class ExtractGithubLinkTest(unittest.TestCase):
+    def test_url_split_across_page_boundary(self):
+        parser = paged_parser([
+            "A Paper Title\nCode: https://github.com/some-\n",
+            "owner/some-repo.\nIntroduction\n",
+        ])
+        self.assertEqual(parser.extract_github_link(), ["https://github.com/some-owner/some-repo"])
+
+    def test_stops_at_first_page_with_links(self):
+        parser = paged_parser([
+            "Title\nhttps://github.com/a/b/tree/main\n",
+            "https://github.com/c/d\n",
+        ])
+        self.assertEqual(parser.extract_github_link(), ["https://github.com/a/b"])
+
+
+if __name__ == "__main__":
+    unittest.main()